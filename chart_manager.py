@@ -7,6 +7,7 @@ This module includes:
 - ChartManager: Class orchestrating the creation and updating of price plots (candlestick),
   volume plots, and indicator overlays/subplots.
 - CandlestickItem: A custom pyqtgraph GraphicsObject for efficiently drawing candlestick charts.
+- VolumeBarsItem: A custom pyqtgraph GraphicsObject drawing all volume bars in one batch.
 """
 
 import pyqtgraph as pg
@@ -14,142 +15,488 @@ from pyqtgraph import DateAxisItem, GraphicsObject, mkPen, mkBrush
 import numpy as np
 import pandas as pd
 import pytz # Used by CandlestickItem for timestamp conversion if needed
-from PySide6 import QtGui, QtCore
+from PySide6 import QtGui, QtCore, QtWidgets
+# PrimitiveArray (numpy-backed QLineF/QRectF arrays) is not public pyqtgraph API; its
+# drawargs() exists since 0.13.3, so requirements.txt pins pyqtgraph to the tested range
+from pyqtgraph.Qt import internals as pg_qt_internals
+from pyqtgraph.Qt import compat as pg_qt_compat       # wrapinstance: pointer -> Qt object
 import logging # Optional
 
+from numba_compat import njit, NUMBA_AVAILABLE
+
 # logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+logger = logging.getLogger(__name__)
+
+
+# --- Timestamp Conversion ---
+# Ticks per second for the datetime64 units pandas uses for DatetimeIndex storage
+_TICKS_PER_SECOND = {'s': np.int64(1), 'ms': np.int64(1_000), 'us': np.int64(1_000_000), 'ns': np.int64(1_000_000_000)}
+
+
+def _datetime_values_to_seconds(values: np.ndarray) -> np.ndarray:
+    """
+    Converts a datetime64 array to int64 Unix seconds.
+
+    The raw int64 ticks are read through a zero-copy view and divided by a typed
+    int64 scalar, so numpy runs a single integer kernel with one output array.
+    Second-resolution input is returned as a view without any copy.
+
+    Args:
+        values (np.ndarray): datetime64 array (any of the s/ms/us/ns units).
+
+    Returns:
+        np.ndarray: int64 seconds since the epoch.
+    """
+    unit = np.datetime_data(values.dtype)[0]
+    ticks_per_second = _TICKS_PER_SECOND.get(unit)
+    if ticks_per_second is None:
+        return values.astype('datetime64[s]').view(np.int64) # Unusual unit: let numpy convert
+    ticks = values.view(np.int64)
+    if ticks_per_second == 1:
+        return ticks
+    return ticks // ticks_per_second
+
+
+def index_to_epoch_seconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Converts a DatetimeIndex to float64 Unix seconds, the X coordinates used by the chart.
+
+    Args:
+        index (pd.DatetimeIndex): Index of the stock data (naive indexes are treated as UTC).
+
+    Returns:
+        np.ndarray: float64 seconds since the epoch, one per index entry.
+    """
+    return _datetime_values_to_seconds(index.values).astype(np.float64)
+
+
+# --- Candle Geometry ---
+def _compute_bar_width(timestamps: np.ndarray, factor: float = 0.7) -> float:
+    """
+    Computes the candle/volume bar width (in seconds) for a series of timestamps.
+
+    Uses ~70% (factor) of the (upper) median positive time difference between points, capped
+    at factor * 5 days so large gaps (e.g. weekly data) don't produce huge bars.
+    Falls back to a daily-like width for a single point or when no positive
+    differences exist; returns 0 for empty input.
+
+    Args:
+        timestamps (np.ndarray): Sorted Unix timestamps (seconds).
+        factor (float): Fraction of the median time difference used as width.
+
+    Returns:
+        float: The bar width in seconds.
+    """
+    n = len(timestamps)
+    if n == 0:
+        return 0.0
+    w = 86400 * factor # Default to daily-like width (single point or median fails)
+    if n > 1:
+        # Calculate differences between timestamps, find median of positive diffs
+        time_diffs = np.diff(timestamps)
+        valid_diffs = time_diffs[time_diffs > 0]
+        if len(valid_diffs) > 0:
+            # Regularly spaced timestamps give a constant diff array, the worst-case input
+            # for selection algorithms; check the whole array (min == max, one O(N) pass
+            # each) so a run of equal diffs at the start can't be mistaken for it.
+            lo, hi = valid_diffs.min(), valid_diffs.max()
+            if lo == hi:
+                median_diff = lo
+            else:
+                # np.partition selects the middle element in O(N) without a full sort
+                mid = len(valid_diffs) // 2
+                median_diff = np.partition(valid_diffs, mid)[mid]
+            w = median_diff * factor
+            # Add a cap to prevent excessively wide candles for large gaps (e.g., weekly)
+            w = min(w, 86400 * 5 * factor) # Example: max width = 70% of 5 days
+    return float(w)
+
+# Candle kinds returned by precompute_candle_geom
+CANDLE_DOWN, CANDLE_FLAT, CANDLE_UP = -1, 0, 1
+
+@njit(cache=True, fastmath=True)
+def _candle_geom_kernel(ts, op, hi, lo, cl, w):
+    """
+    Numba kernel behind precompute_candle_geom (single pass, preallocated outputs).
+
+    Compiled lazily rather than against a pinned signature: pandas hands out
+    read-only column views, which an explicit mutable-array signature rejects.
+    cache=True keeps the compiled code on disk across runs.
+    """
+    n = ts.shape[0]
+    rect_left = np.empty(n, dtype=np.float64)
+    body_top = np.empty(n, dtype=np.float64)
+    body_bottom = np.empty(n, dtype=np.float64)
+    body_height = np.empty(n, dtype=np.float64)
+    kind = np.empty(n, dtype=np.int8)
+    half_w = w / 2
+    for i in range(n):
+        o = op[i]
+        c = cl[i]
+        rect_left[i] = ts[i] - half_w
+        if c > o:
+            body_top[i] = c
+            body_bottom[i] = o
+            kind[i] = 1
+        elif c < o:
+            body_top[i] = o
+            body_bottom[i] = c
+            kind[i] = -1
+        else:
+            body_top[i] = o
+            body_bottom[i] = o
+            kind[i] = 0
+        body_height[i] = body_top[i] - body_bottom[i]
+    return rect_left, body_top, body_bottom, body_height, kind
+
+
+def precompute_candle_geom(ts, op, hi, lo, cl, w):
+    """
+    Computes per-candle drawing geometry for CandlestickItem.
+
+    Uses the Numba kernel when Numba is installed, otherwise equivalent
+    vectorized NumPy operations.
+
+    Args:
+        ts, op, hi, lo, cl (np.ndarray): float64 timestamp and OHLC arrays.
+        w (float): Candle body width in seconds.
+
+    Returns:
+        tuple: (rect_left, body_top, body_bottom, body_height, kind) arrays, where
+               kind is CANDLE_UP, CANDLE_DOWN or CANDLE_FLAT (int8) per candle.
+    """
+    if NUMBA_AVAILABLE:
+        return _candle_geom_kernel(ts, op, hi, lo, cl, float(w))
+    body_top = np.maximum(op, cl)
+    body_bottom = np.minimum(op, cl)
+    kind = np.sign(cl - op).astype(np.int8)
+    return ts - w / 2, body_top, body_bottom, body_top - body_bottom, kind
+
+
+def _fill_primitive_array(prim, *columns):
+    """
+    Resizes a pyqtgraph PrimitiveArray and writes its fields column by column.
+
+    Args:
+        prim: PrimitiveArray of QLineF or QRectF (4 float fields each).
+        *columns: One entry per field; arrays of equal length or scalars (broadcast).
+    """
+    n = max((len(col) for col in columns if np.ndim(col) > 0), default=0)
+    prim.resize(n)
+    buf = prim.ndarray()
+    for j, col in enumerate(columns):
+        buf[:, j] = col
+
+
+def _downsample_ohlc(ts, op, hi, lo, cl, seconds_per_px: float):
+    """
+    Aggregates candles into per-pixel buckets when they are denser than the screen.
+
+    If there are more than two candles per horizontal pixel, contiguous candles are
+    grouped into buckets of ceil(candles / pixels) and each bucket is replaced by one
+    synthetic candle: first open, last close, max high, min low, mean timestamp.
+    All reductions are NumPy ufunc.reduceat calls.
+
+    Args:
+        ts, op, hi, lo, cl (np.ndarray): Sorted timestamp and OHLC arrays.
+        seconds_per_px (float): Horizontal scale of the view (seconds per pixel).
+
+    Returns:
+        tuple: (ts, op, hi, lo, cl, bucket_size). The input arrays are returned
+               unchanged with bucket_size 1 when no downsampling is needed.
+    """
+    n = len(ts)
+    if n < 2 or seconds_per_px <= 0:
+        return ts, op, hi, lo, cl, 1
+    pixels = (ts[-1] - ts[0]) / seconds_per_px
+    if n <= 2 * max(pixels, 1.0):
+        return ts, op, hi, lo, cl, 1
+
+    bucket = int(np.ceil(n / max(pixels, 1.0)))
+    starts = np.arange(0, n, bucket)
+    ends = np.minimum(starts + bucket, n) - 1 # Index of the last candle in each bucket
+    counts = ends - starts + 1
+    return (
+        np.add.reduceat(ts, starts) / counts,
+        op[starts],
+        np.maximum.reduceat(hi, starts),
+        np.minimum.reduceat(lo, starts),
+        cl[ends],
+        bucket,
+    )
+
+
+def _visible_y_range(dates: np.ndarray, lows: np.ndarray, highs: np.ndarray, start_ts: float, end_ts: float):
+    """
+    Returns (min(lows), max(highs)) over the points with start_ts <= date <= end_ts.
+
+    Args:
+        dates (np.ndarray): Sorted timestamps.
+        lows, highs (np.ndarray): Lower/upper values aligned with dates (may be the same array).
+        start_ts, end_ts (float): Visible X range.
+
+    Returns:
+        tuple | None: (y_min, y_max), or None if no point lies in the range.
+    """
+    i0 = int(np.searchsorted(dates, start_ts, side='left'))
+    i1 = int(np.searchsorted(dates, end_ts, side='right'))
+    if i1 <= i0:
+        return None
+    return float(lows[i0:i1].min()), float(highs[i0:i1].max())
+
+
+def _merge_ranges(a, b):
+    """Union of two (min, max) ranges, either of which may be None."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a[0], b[0]), max(a[1], b[1])
+
+
+class _PrimitiveBatch:
+    """
+    A PrimitiveArray of QLineF/QRectF rows plus the X key (timestamp) of each row.
+
+    Rows are stored in ascending key order, so a paint() call can draw only the
+    contiguous run of rows that intersects the exposed rectangle.
+    """
+    def __init__(self, klass):
+        self.klass = klass
+        self.prim = pg_qt_internals.PrimitiveArray(klass, 4)
+        self.keys = np.empty(0, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.prim)
+
+    def fill(self, keys, *columns):
+        """Replaces the rows (see _fill_primitive_array); keys must be sorted ascending."""
+        _fill_primitive_array(self.prim, *columns)
+        self.keys = np.ascontiguousarray(keys, dtype=np.float64)
+
+    def slice_for(self, x_lo: float, x_hi: float) -> tuple:
+        """Returns (start, stop) of the rows whose key lies within [x_lo, x_hi]."""
+        return (int(np.searchsorted(self.keys, x_lo, side='left')),
+                int(np.searchsorted(self.keys, x_hi, side='right')))
+
+    def drawargs(self, start: int, stop: int) -> tuple:
+        """Arguments for QPainter.drawLines/drawRects covering rows [start, stop)."""
+        args = self.prim.drawargs()
+        if start == 0 and stop == len(self.prim):
+            return args
+        if len(args) == 2:
+            # (pointer, count) form: point straight into the buffer at row 'start'
+            rows = self.prim.ndarray()[start:stop]
+            return pg_qt_compat.wrapinstance(rows.ctypes.data, self.klass), stop - start
+        return (args[0][start:stop],) # List / sip.array form supports slicing
+
 
 # --- Custom Candlestick Item ---
 class CandlestickItem(GraphicsObject):
     """
     Custom pyqtgraph GraphicsObject for displaying candlestick charts.
 
-    Efficiently draws candlesticks using QPainter and QPicture caching.
+    Efficiently draws candlesticks by painting cached QLineF/QRectF batches
+    directly (one drawLines/drawRects call per pen/brush combination).
     Supports hollow green candles for upward price movement and solid red
     for downward movement. Automatically calculates candle width based on
     the median time difference between data points.
     """
-    def __init__(self, data: list):
+    # --- Pens and Brushes (shared by all instances, built once at import) ---
+    # Colors defined using RGB tuples (more explicit than letters)
+    COLOR_UP = (0, 180, 0)       # Green
+    COLOR_DOWN = (200, 60, 60)   # Red
+    PEN_WICK_UP = mkPen(color=COLOR_UP, width=1)
+    PEN_WICK_DOWN = mkPen(color=COLOR_DOWN, width=1)
+    PEN_BODY_UP = mkPen(color=COLOR_UP, width=1) # Outline for hollow candle
+    BRUSH_BODY_DOWN = mkBrush(COLOR_DOWN)        # Solid fill for down candle
+    BRUSH_HOLLOW = mkBrush(None)                 # No fill for up candle
+    PEN_SOLID_BODY_DOWN = mkPen(None)            # No outline for filled candle
+
+    def __init__(self, t: np.ndarray, o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray,
+                 width: float | None = None):
         """
         Initializes the CandlestickItem.
 
+        Data is stored column-wise (one contiguous array per field) rather than as a
+        list of per-candle dictionaries, so width/extent calculations run as NumPy
+        reductions and the draw loop only indexes arrays.
+
         Args:
-            data (list): A list of dictionaries, where each dictionary represents one candle
-                         and must contain keys: 't' (Unix timestamp), 'o' (open), 'h' (high),
-                         'l' (low), 'c' (close).
+            t (np.ndarray): Unix timestamps (seconds) of each candle, sorted ascending.
+            o (np.ndarray): Open prices.
+            h (np.ndarray): High prices.
+            l (np.ndarray): Low prices.
+            c (np.ndarray): Close prices.
+            width (float, optional): Candle body width in seconds. If None, it is
+                                     derived from the timestamps via _compute_bar_width.
         """
         GraphicsObject.__init__(self)
-        self.data = data  # Store the data for drawing and bounding box calculation
-        self.picture = None # QPicture cache for efficient drawing
-        self.generatePicture() # Initial drawing pass
-
-    def generatePicture(self):
+        self._set_arrays(t, o, h, l, c) # Store the data for drawing and bounding box calculation
+        # Cached draw geometry, backed by NumPy buffers (filled without per-candle Python objects)
+        self._wick_lines_up = _PrimitiveBatch(QtCore.QLineF)   # Up + flat candle wicks
+        self._wick_lines_down = _PrimitiveBatch(QtCore.QLineF) # Down candle wicks
+        self._flat_lines = _PrimitiveBatch(QtCore.QLineF)      # Body line of flat candles
+        self._body_rects_up = _PrimitiveBatch(QtCore.QRectF)   # Hollow green bodies
+        self._body_rects_down = _PrimitiveBatch(QtCore.QRectF) # Solid red bodies
+        self._drawn_w = 0.0 # Candle width used for the cached geometry (after bucketing)
+        # Ask Qt to fill option.exposedRect so paint() can skip candles outside the damaged area
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+        self._cached_w = 0.0 # Candle body width in seconds, shared by drawing and bounds
+        self._cached_bounds = QtCore.QRectF() # Returned as-is by boundingRect()
+        self._draw_range = None # (x0, x1) time range covered by the geometry; None = all data
+        self._seconds_per_px = None # Horizontal view scale, used to bucket sub-pixel candles
+        self._recompute_cache(width) # Width + bounds are computed once per data change
+        self.generateGeometry() # Initial geometry pass
+
+    def _set_arrays(self, t, o, h, l, c):
+        """Stores the OHLC columns as float64 NumPy arrays of equal length."""
+        self.ts = np.asarray(t, dtype=np.float64)
+        self.opens = np.asarray(o, dtype=np.float64)
+        self.highs = np.asarray(h, dtype=np.float64)
+        self.lows = np.asarray(l, dtype=np.float64)
+        self.closes = np.asarray(c, dtype=np.float64)
+
+    def _recompute_cache(self, width: float | None = None):
         """
-        Generates the QPicture used for painting the candlesticks.
+        Recomputes the candle width and bounding rectangle for the current data.
 
-        This method pre-renders the candlestick shapes based on the current data.
-        It calculates widths and sets appropriate pens/brushes for up/down candles.
+        boundingRect() is polled by Qt on every repaint and mouse move, so the
+        O(N) work lives here and only runs when the data changes.
+
+        Args:
+            width (float, optional): Precomputed candle width in seconds (e.g. shared
+                                     with the volume bars). Computed here if None.
         """
-        self.picture = QtGui.QPicture()
-        if not self.data:
-            # Need to create and end painter even if there's no data for QPicture
-            p = QtGui.QPainter(self.picture)
-            p.end()
+        if len(self.ts) == 0:
+            self._cached_w = 0.0
+            self._cached_bounds = QtCore.QRectF() # Empty rectangle if no data
             return
 
-        p = QtGui.QPainter(self.picture)
-
-        # --- Calculate Candle Width ---
-        # Use ~70% of the median time difference between points for width
-        width_factor = 0.7 # Percentage of time diff for width
-        w = 0 # Calculated width in seconds
-        if len(self.data) > 1:
-            # Extract timestamps, calculate differences, find median of positive diffs
-            time_stamps = np.array([d['t'] for d in self.data])
-            time_diffs = np.diff(time_stamps)
-            valid_diffs = time_diffs[time_diffs > 0]
-            if len(valid_diffs) > 0:
-                median_diff = np.median(valid_diffs)
-                w = median_diff * width_factor
-                # Add a cap to prevent excessively wide candles for large gaps (e.g., weekly)
-                w = min(w, 86400 * 5 * width_factor) # Example: max width = 70% of 5 days
-            else: # Only one diff, or all diffs zero/negative? Use default.
-                 w = 86400 * width_factor # Default to daily-like width if median fails
-        elif len(self.data) == 1:
-            # Only one data point, estimate width (e.g., assume daily)
-            w = 86400 * width_factor
-        else: # No data
-             w = 0
-
-        # --- Define Pens and Brushes (optimized) ---
-        # Colors defined using RGB tuples (more explicit than letters)
-        color_up = (0, 180, 0)       # Green
-        color_down = (200, 60, 60)   # Red
-        pen_wick_up = mkPen(color=color_up, width=1)
-        pen_wick_down = mkPen(color=color_down, width=1)
-        pen_body_up = mkPen(color=color_up, width=1) # Outline for hollow candle
-        brush_body_down = mkBrush(color_down)        # Solid fill for down candle
-        brush_hollow = mkBrush(None)                 # No fill for up candle
-        pen_solid_body_down = mkPen(None)            # No outline for filled candle
-
-        # --- Draw Each Candle ---
-        for d in self.data:
-            # Extract OHLC and timestamp for the current candle
-            t, o, h, l, c = d['t'], d['o'], d['h'], d['l'], d['c']
-
-            # Determine candle type (up, down, or flat)
-            is_up = c > o
-            is_flat = c == o
-
-            # --- Draw Wicks (vertical lines) ---
-            wick_pen = pen_wick_up if (is_up or is_flat) else pen_wick_down
-            p.setPen(wick_pen)
-            body_top = max(o, c)    # Top edge of the candle body
-            body_bottom = min(o, c) # Bottom edge of the candle body
-            # Draw upper wick: from high to top of body
-            p.drawLine(QtCore.QPointF(t, h), QtCore.QPointF(t, body_top))
-            # Draw lower wick: from low to bottom of body
-            p.drawLine(QtCore.QPointF(t, l), QtCore.QPointF(t, body_bottom))
-
-            # --- Draw Body (rectangle) ---
-            rect_left = t - w / 2
-            rect_top = o # QRectF draws from top-left; 'o' is the top if c > o
-            rect_width = w
-            rect_height = c - o # Height = close - open (can be negative)
-
-            if is_up: # Hollow green body
-                p.setPen(pen_body_up)
-                p.setBrush(brush_hollow)
-                p.drawRect(QtCore.QRectF(rect_left, rect_top, rect_width, rect_height))
-            elif is_flat: # Draw a horizontal line for flat candles
-                 p.setPen(pen_wick_down) # Use a neutral or down color?
-                 p.drawLine(QtCore.QPointF(rect_left, o), QtCore.QPointF(rect_left + rect_width, o))
-            else: # Solid red body (down candle)
-                p.setPen(pen_solid_body_down)
-                p.setBrush(brush_body_down)
-                # QRectF handles negative height correctly by drawing from 'o' downwards to 'c'
-                p.drawRect(QtCore.QRectF(rect_left, rect_top, rect_width, rect_height))
-
-        p.end() # Finish painting the QPicture
+        w = _compute_bar_width(self.ts) if width is None else width
+        self._cached_w = float(w)
+
+        # --- Calculate Bounding Box ---
+        # Find overall min/max timestamps, highs, and lows, padded by half a candle width.
+        # Timestamps are sorted ascending, so the time extent is just the end points.
+        min_t, max_t = self.ts[0], self.ts[-1]
+        min_l, max_h = self.lows.min(), self.highs.max()
+        bounding_min_t = min_t - w / 2
+        bounding_max_t = max_t + w / 2
+        height = max_h - min_l
+        # Ensure height is non-zero if min_l == max_h
+        if height < 1e-9: height = 1.0 # Avoid zero-height bounding box
+        self._cached_bounds = QtCore.QRectF(bounding_min_t, min_l, bounding_max_t - bounding_min_t, height)
+
+    def generateGeometry(self):
+        """
+        Builds the cached line/rect batches used by paint().
+
+        Each batch is a PrimitiveArray whose NumPy buffer is written column-wise, so
+        no Python object is created per candle; paint() then hands each buffer to a
+        single QPainter drawLines/drawRects call.
+        """
+        # --- Restrict to the drawn time range (viewport culling) ---
+        # Only candles inside _draw_range (plus one on each side) are built; the
+        # timestamps are sorted, so the slice bounds come from a binary search.
+        i0, i1 = 0, len(self.ts)
+        if self._draw_range is not None:
+            i0 = max(int(np.searchsorted(self.ts, self._draw_range[0], side='left')) - 1, 0)
+            i1 = min(int(np.searchsorted(self.ts, self._draw_range[1], side='right')) + 1, len(self.ts))
+
+        # Candle width is computed once per data change in _recompute_cache()
+        w = self._cached_w
+        ts, op, hi, lo, cl = self.ts[i0:i1], self.opens[i0:i1], self.highs[i0:i1], self.lows[i0:i1], self.closes[i0:i1]
+
+        # --- Density-aware downsampling ---
+        # When several candles would share a pixel, draw one aggregated candle per
+        # bucket instead; bucketed candles are widened to span their bucket.
+        if self._seconds_per_px is not None:
+            ts, op, hi, lo, cl, bucket = _downsample_ohlc(ts, op, hi, lo, cl, self._seconds_per_px)
+            w *= bucket
+
+        # --- Per-candle geometry ---
+        # Classification and body edges are computed once for all candles (compiled
+        # with Numba when available).
+        rect_left, body_top, body_bottom, body_height, kind = precompute_candle_geom(
+            ts, op, hi, lo, cl, w
+        )
+        up = kind == CANDLE_UP
+        down = kind == CANDLE_DOWN
+        flat = kind == CANDLE_FLAT
+        up_wick = ~down # Up and flat candles share the up wick pen
+        self._drawn_w = w
+
+        # --- Wicks (vertical lines) ---
+        # Upper wick: from high to top of body; lower wick: from low to bottom of body.
+        # Both lines of a candle are stored next to each other so rows stay time-sorted.
+        t_up = np.repeat(ts[up_wick], 2)
+        self._wick_lines_up.fill(
+            t_up, t_up,
+            np.column_stack((hi[up_wick], lo[up_wick])).ravel(),
+            t_up,
+            np.column_stack((body_top[up_wick], body_bottom[up_wick])).ravel(),
+        )
+        t_down = np.repeat(ts[down], 2)
+        self._wick_lines_down.fill(
+            t_down, t_down,
+            np.column_stack((hi[down], lo[down])).ravel(),
+            t_down,
+            np.column_stack((body_top[down], body_bottom[down])).ravel(),
+        )
+        # Horizontal body line of flat candles (drawn with the down wick pen)
+        left_flat = rect_left[flat]
+        self._flat_lines.fill(ts[flat], left_flat, op[flat], left_flat + w, op[flat])
 
-    def paint(self, p: QtGui.QPainter, *args):
+        # --- Bodies (rectangles) ---
+        self._body_rects_up.fill(ts[up], rect_left[up], body_bottom[up], w, body_height[up])
+        self._body_rects_down.fill(ts[down], rect_left[down], body_bottom[down], w, body_height[down])
+
+    def paint(self, p: QtGui.QPainter, option=None, widget=None):
         """
         Called by pyqtgraph/Qt framework to draw the item.
 
+        Draws the cached geometry batches; the pen/brush changes a fixed number of
+        times regardless of how many candles there are. Only candles intersecting
+        option.exposedRect are drawn, so partial repaints touch a fraction of the data.
+
         Args:
             p (QtGui.QPainter): The painter object provided by the framework.
-            *args: Additional arguments from the framework.
+            option (QStyleOptionGraphicsItem): Style option; exposedRect is in item coordinates.
+            widget (QWidget): The widget being painted on (unused).
         """
-        # Check if picture cache is valid, generate if needed (shouldn't normally happen here)
-        if self.picture is None:
-             self.generatePicture()
-
-        # Draw the pre-rendered QPicture at the item's local origin (0,0)
-        # The picture itself contains coordinates relative to the data values.
-        if self.picture and not self.picture.isNull():
-            p.drawPicture(0, 0, self.picture)
-
+        x_lo, x_hi = -np.inf, np.inf
+        if option is not None:
+            exposed = option.exposedRect
+            if exposed.isValid():
+                # Pad by a full candle width so partially exposed bodies are included
+                x_lo = exposed.left() - self._drawn_w
+                x_hi = exposed.right() + self._drawn_w
+
+        # Wicks and bodies are axis-aligned, 1px-wide shapes: antialiasing them only adds
+        # raster cost. Turn it off explicitly, whatever the global option or the painter's
+        # state; indicator curves set their own hint (see set_render_hints).
+        p.save()
+        p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+        p.setBrush(self.BRUSH_HOLLOW)
+        for batch, pen in ((self._wick_lines_up, self.PEN_WICK_UP),
+                           (self._wick_lines_down, self.PEN_WICK_DOWN),
+                           (self._flat_lines, self.PEN_WICK_DOWN)):
+            start, stop = batch.slice_for(x_lo, x_hi)
+            if stop > start:
+                p.setPen(pen)
+                p.drawLines(*batch.drawargs(start, stop))
+        start, stop = self._body_rects_up.slice_for(x_lo, x_hi)
+        if stop > start:
+            p.setPen(self.PEN_BODY_UP)
+            p.drawRects(*self._body_rects_up.drawargs(start, stop))
+        start, stop = self._body_rects_down.slice_for(x_lo, x_hi)
+        if stop > start:
+            p.setPen(self.PEN_SOLID_BODY_DOWN)
+            p.setBrush(self.BRUSH_BODY_DOWN)
+            p.drawRects(*self._body_rects_down.drawargs(start, stop))
+        p.restore()
 
     def boundingRect(self) -> QtCore.QRectF:
         """
@@ -160,60 +507,154 @@ class CandlestickItem(GraphicsObject):
         drawn candlesticks (highs, lows, and widths).
 
         Returns:
-            QtCore.QRectF: The calculated bounding rectangle. Returns an empty rect if no data.
+            QtCore.QRectF: The cached bounding rectangle (see _recompute_cache).
+                           Returns an empty rect if no data.
         """
-        if not self.data:
-            return QtCore.QRectF() # Empty rectangle if no data
+        return self._cached_bounds
 
-        try:
-            # Find overall min/max timestamps, highs, and lows
-            all_t = [d['t'] for d in self.data]
-            all_h = [d['h'] for d in self.data]
-            all_l = [d['l'] for d in self.data]
-            min_t, max_t = min(all_t), max(all_t)
-            min_l, max_h = min(all_l), max(all_h)
-
-            # Calculate width factor for bounding box adjustment (similar to generatePicture)
-            width_factor = 0.7
-            if len(self.data) > 1:
-                time_diffs = np.diff(np.array(all_t))
-                valid_diffs = time_diffs[time_diffs > 0]
-                if len(valid_diffs) > 0:
-                    median_diff = np.median(valid_diffs)
-                    w_factor = median_diff * width_factor
-                    w_factor = min(w_factor, 86400 * 5 * width_factor)
-            elif len(self.data) == 1:
-                 w_factor = 86400 * width_factor # Estimate for single point
-            else:
-                 w_factor = 0
-
-            # Calculate bounding box coordinates, including half candle width padding
-            bounding_min_t = min_t - w_factor / 2
-            bounding_max_t = max_t + w_factor / 2
-            width = bounding_max_t - bounding_min_t
-            height = max_h - min_l
+    def set_view_range(self, x0: float, x1: float, px_width: float | None = None):
+        """
+        Limits rendering to the candles around the visible time range [x0, x1].
 
-            # Ensure height is non-zero if min_l == max_h
-            if height < 1e-9: height = 1.0 # Avoid zero-height bounding box
+        If the view's pixel width is given, candles denser than two per pixel are
+        aggregated into per-pixel buckets (see _downsample_ohlc).
 
-            return QtCore.QRectF(bounding_min_t, min_l, width, height)
-        except Exception as e:
-             print(f"Error calculating bounding rect for CandlestickItem: {e}")
-             # logging.error("Error calculating candlestick bounding rect", exc_info=True)
-             return QtCore.QRectF() # Return empty on error
+        Geometry is built with one view-width of margin on each side, so small pans
+        reuse it; it is only rebuilt once the view leaves the drawn range or is zoomed
+        in far enough that most of the drawn candles would be off-screen.
 
-    def setData(self, data: list):
+        Args:
+            x0 (float): Left edge of the visible range (Unix timestamp).
+            x1 (float): Right edge of the visible range (Unix timestamp).
+            px_width (float, optional): Width of the view in pixels.
+        """
+        span = x1 - x0
+        if span <= 0:
+            return
+        if self._draw_range is not None:
+            d0, d1 = self._draw_range
+            if d0 <= x0 and x1 <= d1 and (d1 - d0) <= 4 * span:
+                return # Current geometry already covers the view
+        self._draw_range = (x0 - span, x1 + span)
+        self._seconds_per_px = span / px_width if px_width and px_width > 0 else None
+        self.generateGeometry()
+        self.update()
+
+    def setData(self, t: np.ndarray, o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray,
+                width: float | None = None):
         """
         Updates the data used by the CandlestickItem and triggers a redraw.
 
         Args:
-            data (list): The new list of candle dictionaries.
+            t, o, h, l, c (np.ndarray): The new timestamp and OHLC arrays.
+            width (float, optional): Candle body width in seconds (computed if None).
+        """
+        self.prepareGeometryChange() # Inform pyqtgraph the bounds are about to change
+        self._set_arrays(t, o, h, l, c)
+        self._recompute_cache(width) # Refresh cached width and bounding rect
+        self.generateGeometry() # Rebuild the cached draw batches
+        self.update() # Request a repaint
+
+
+# --- Custom Volume Bars Item ---
+class VolumeBarsItem(GraphicsObject):
+    """
+    Custom pyqtgraph GraphicsObject for displaying volume bars.
+
+    All bars share one brush and pen, so they are kept in a single QRectF batch
+    (same mechanism as CandlestickItem) and painted with one drawRects call.
+    """
+    def __init__(self, x: np.ndarray, height: np.ndarray, width: float, brush=None, pen=None):
+        """
+        Initializes the VolumeBarsItem.
+
+        Args:
+            x (np.ndarray): Bar centre positions (Unix timestamps).
+            height (np.ndarray): Bar heights (volume values).
+            width (float): Bar width in seconds (see _compute_bar_width).
+            brush: Fill brush for all bars (pg.mkBrush compatible).
+            pen: Outline pen for all bars (pg.mkPen compatible, None for no outline).
         """
-        self.data = data
-        self.generatePicture() # Regenerate the QPicture cache
-        self.prepareGeometryChange() # Inform pyqtgraph the bounds might change
+        GraphicsObject.__init__(self)
+        self._brush = mkBrush(brush)
+        self._pen = mkPen(pen)
+        self._rects = pg_qt_internals.PrimitiveArray(QtCore.QRectF, 4)
+        self._cached_bounds = QtCore.QRectF()
+        self.setData(x, height, width)
+
+    def setData(self, x: np.ndarray, height: np.ndarray, width: float):
+        """
+        Updates the bars and triggers a redraw.
+
+        Args:
+            x (np.ndarray): Bar centre positions (Unix timestamps).
+            height (np.ndarray): Bar heights (volume values).
+            width (float): Bar width in seconds.
+        """
+        self.prepareGeometryChange() # Inform pyqtgraph the bounds are about to change
+        x = np.asarray(x, dtype=np.float64)
+        height = np.asarray(height, dtype=np.float64)
+        _fill_primitive_array(self._rects, x - width / 2, 0.0, width, height)
+
+        if len(x) == 0:
+            self._cached_bounds = QtCore.QRectF() # Empty rectangle if no data
+        else:
+            # Bars start at 0, so the Y extent always includes the baseline
+            y_min = min(float(height.min()), 0.0)
+            y_max = max(float(height.max()), 0.0)
+            self._cached_bounds = QtCore.QRectF(
+                x[0] - width / 2, y_min, (x[-1] - x[0]) + width, max(y_max - y_min, 1.0)
+            )
         self.update() # Request a repaint
 
+    def paint(self, p: QtGui.QPainter, *args):
+        """Draws all bars with a single drawRects call (no antialiasing, bars are axis-aligned)."""
+        if len(self._rects):
+            p.save()
+            p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+            p.setPen(self._pen)
+            p.setBrush(self._brush)
+            p.drawRects(*self._rects.drawargs())
+            p.restore()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        """Returns the cached bounding rectangle of all bars."""
+        return self._cached_bounds
+
+
+# --- Date Axis With Cached Labels ---
+class CachedDateAxisItem(DateAxisItem):
+    """
+    DateAxisItem that memoizes tick label strings.
+
+    While panning, most ticks stay on the same time grid, yet DateAxisItem
+    rebuilds a datetime object and calls strftime for every tick on every
+    redraw. Labels only depend on the tick value, the format chosen for the
+    current zoom level/spacing and the UTC offset, so they are cached on that
+    key in a dict shared by all axes (cleared once it grows past LABEL_CACHE_SIZE).
+    """
+    LABEL_CACHE_SIZE = 4096
+    _label_cache = {} # {((format, utcOffset), value): label}
+
+    def tickStrings(self, values, scale, spacing):
+        """Returns cached labels, formatting only the values not seen before."""
+        tick_spec = next((s for s in self.zoomLevel.tickSpecs if s.spacing == spacing), None)
+        if tick_spec is None:
+            return super().tickStrings(values, scale, spacing)
+
+        cache = self._label_cache
+        key_prefix = (tick_spec.format, self.utcOffset)
+        missing = [v for v in values if (key_prefix, v) not in cache]
+        if not missing:
+            return [cache[(key_prefix, v)] for v in values]
+        fresh = dict(zip(missing, super().tickStrings(missing, scale, spacing)))
+        # Read the cached labels before a possible overflow clear below removes them
+        labels = [fresh[v] if v in fresh else cache[(key_prefix, v)] for v in values]
+        if len(cache) + len(fresh) > self.LABEL_CACHE_SIZE:
+            cache.clear()
+        cache.update(((key_prefix, v), label) for v, label in fresh.items())
+        return labels
+
 
 # --- Chart Manager ---
 class ChartManager:
@@ -222,12 +663,16 @@ class ChartManager:
 
     Handles the creation, clearing, and updating of:
     - A primary price chart (using CandlestickItem).
-    - A volume chart (using BarGraphItem).
+    - A volume chart (using VolumeBarsItem).
     - Indicator overlays on the price chart.
     - Indicator subplots below the volume chart.
 
     Ensures that the X-axes of all plots are linked for synchronized panning/zooming.
     """
+    # Volume bar styling (shared, built once at import)
+    VOLUME_BRUSH = mkBrush(0, 100, 150, 180) # Volume bar color
+    VOLUME_PEN = mkPen(None)                 # No border on volume bars
+
     def __init__(self, graphics_widget: pg.GraphicsLayoutWidget):
         """
         Initializes the ChartManager.
@@ -244,34 +689,54 @@ class ChartManager:
         self.price_plot = None          # PlotItem for price chart (row 0)
         self.volume_plot = None         # PlotItem for volume chart (row 1)
         self.indicator_plots = {}       # {indicator_id: PlotItem/PlotDataItem} for subplots/overlays
+        self._subplot_curves = {}       # {indicator_id: PlotDataItem} drawn inside each subplot PlotItem
         self.candlestick_item = None    # The CandlestickItem instance
-        self.volume_item = None         # The BarGraphItem instance for volume
+        self.volume_item = None         # The VolumeBarsItem instance for volume
         self.main_plot_dates = None     # numpy array of Unix timestamps for the main data
+        self.volume_values = None       # numpy array of volume values aligned with main_plot_dates
+        self._close_np = None           # float64 close prices aligned with main_plot_dates
+        self._mask_cache = {}           # {id(values): (values, x, dates, arr)} memoized _align() results
+        self.indicator_points = {}      # {indicator_id: (dates, values)} as plotted (NaNs removed)
+        self.bottom_plot = None         # Bottom-most PlotItem; the only one showing the date axis
+        self._pen_cache = {}            # {(color, width): QPen} so replots don't rebuild identical pens
+        # Rendering settings applied to every indicator curve (see set_render_hints)
+        self._render_hints = {'downsample': True, 'clip': True, 'antialias': False}
+
+        # Coalesces X-range changes (pan/zoom) into at most one candle re-cull per ~frame
+        self._view_range_timer = QtCore.QTimer()
+        self._view_range_timer.setSingleShot(True)
+        self._view_range_timer.setInterval(16)
+        self._view_range_timer.timeout.connect(self._apply_candle_view_range)
 
         # Basic pyqtgraph configuration (can be overridden by themes)
         pg.setConfigOption('background', 'w') # Default white background
         pg.setConfigOption('foreground', 'k') # Default black foreground
-        pg.setConfigOption('antialias', True) # Enable antialiasing for smoother lines
-        print("ChartManager initialized.")
-        # logging.info("ChartManager initialized.")
+        pg.setConfigOption('antialias', False) # Off by default (matches main()); curves follow set_render_hints()
+        logger.debug("ChartManager initialized.")
 
     def clear_chart(self):
         """
         Clears all plots, items, and internal references from the graphics layout.
         Resets the manager to a clean state.
         """
-        print("Clearing chart...")
-        # logging.info("Clearing chart")
+        logger.debug("Clearing chart...")
+        self._view_range_timer.stop()
         self.graphics_widget.clear() # This removes all PlotItems and Labels
 
         # Reset internal references
         self.price_plot = None
         self.volume_plot = None
         self.indicator_plots = {}
+        self._subplot_curves = {}
         self.candlestick_item = None
         self.volume_item = None
         self.ticker_label = ""
         self.main_plot_dates = None
+        self.volume_values = None
+        self._close_np = None
+        self._mask_cache = {}
+        self.indicator_points = {}
+        self.bottom_plot = None
         # Optionally add a default message back
         # self.graphics_widget.addLabel("Chart cleared.", row=0, col=0)
 
@@ -281,7 +746,7 @@ class ChartManager:
         and Volume bars in the plot below (row 1).
 
         This method creates the necessary PlotItems, prepares the data,
-        instantiates CandlestickItem and BarGraphItem, adds them to the plots,
+        instantiates CandlestickItem and VolumeBarsItem, adds them to the plots,
         links the X-axes, and sets basic plot appearance.
 
         Args:
@@ -293,45 +758,22 @@ class ChartManager:
         # --- Pre-checks ---
         # Caller should ensure chart is cleared if necessary before calling this.
         if data is None or data.empty:
-            print("ChartManager: No stock data provided to plot.")
-            # logging.warning("plot_stock_data skipped: Data is None or empty.")
+            logger.warning("ChartManager: No stock data provided to plot.")
             self.graphics_widget.addLabel(f"No data available for {ticker}", row=0, col=0)
             return
 
-        print(f"Plotting main stock data for {ticker}...")
-        # logging.info(f"Plotting stock data for {ticker}")
+        logger.debug("Plotting main stock data for %s...", ticker)
         self.ticker_label = ticker
 
         # --- Data Preparation ---
-        required_cols = ["Open", "High", "Low", "Close", "Volume"]
         try:
-            # Validate index type
-            if not isinstance(data.index, pd.DatetimeIndex):
-                 raise ValueError("Data index must be a DatetimeIndex.")
-            # Validate required columns
-            if not all(col in data.columns for col in required_cols):
-                missing = [c for c in required_cols if c not in data.columns]
-                raise ValueError(f"Data is missing required columns: {missing}")
-
-            # Convert index to UTC timestamps (seconds since epoch) - consistent internal representation
-            if hasattr(data.index, 'tz') and data.index.tz is not None:
-                 # If index is timezone-aware, convert to UTC
-                 self.main_plot_dates = data.index.tz_convert('UTC').astype(np.int64) // 10**9
-            else:
-                 # If index is naive, assume UTC (or localize if needed, but UTC is safer)
-                 self.main_plot_dates = data.index.tz_localize('UTC').astype(np.int64) // 10**9
-
-            # Prepare data list for CandlestickItem
-            candlestick_data = [
-                {'t': self.main_plot_dates[i], 'o': data['Open'].iloc[i], 'h': data['High'].iloc[i], 'l': data['Low'].iloc[i], 'c': data['Close'].iloc[i]}
-                for i in range(len(data))
-            ]
-            # Prepare volume data array
-            volume_values = data['Volume'].values
+            self.main_plot_dates, opens, highs, lows, closes, volume_values = self._prepare_stock_arrays(data)
+            self.volume_values = volume_values
+            self._close_np = closes
+            self._mask_cache = {}
 
         except Exception as e:
-            print(f"Error preparing stock data for plotting: {e}")
-            # logging.error(f"Error preparing plot data for {ticker}: {e}", exc_info=True)
+            logger.error("Error preparing stock data for plotting: %s", e)
             # Display error on chart area
             self.graphics_widget.addLabel(f"Error preparing data for {ticker}", row=0, col=0)
             return
@@ -344,7 +786,7 @@ class ChartManager:
         self.price_plot.hideAxis('bottom') # Volume plot will show the shared bottom axis
 
         # Volume Plot (Row 1)
-        date_axis = DateAxisItem(orientation='bottom') # Use DateAxisItem for nice date formatting
+        date_axis = CachedDateAxisItem(orientation='bottom') # Date-formatted ticks (labels are memoized)
         self.volume_plot = self.graphics_widget.addPlot(row=1, col=0, axisItems={'bottom': date_axis})
         self.volume_plot.setLabel('left', 'Volume')
         self.volume_plot.showGrid(x=True, y=True, alpha=0.2) # Show full grid for volume
@@ -353,32 +795,22 @@ class ChartManager:
         # --- Link X Axes ---
         # This is crucial for synchronized panning and zooming!
         self.volume_plot.setXLink(self.price_plot)
+        # Volume is the bottom plot until an indicator subplot is added below it
+        self.bottom_plot = self.volume_plot
 
         # --- Add Candlestick Item ---
-        self.candlestick_item = CandlestickItem(candlestick_data)
+        # Candle and volume bar widths are identical, so compute the width once
+        bar_width = _compute_bar_width(self.main_plot_dates)
+        self.candlestick_item = CandlestickItem(self.main_plot_dates, opens, highs, lows, closes, width=bar_width)
         self.price_plot.addItem(self.candlestick_item)
+        # Re-cull off-screen candles whenever the visible X range changes
+        self.price_plot.sigXRangeChanged.connect(self._on_price_x_range_changed)
 
         # --- Add Volume Bar Item ---
-        # Calculate volume bar width (similar to candlestick width)
-        width_factor = 0.7
-        bar_width = 0
-        if len(self.main_plot_dates) > 1:
-            time_diffs = np.diff(self.main_plot_dates)
-            valid_diffs = time_diffs[time_diffs > 0]
-            if len(valid_diffs) > 0:
-                median_diff = np.median(valid_diffs)
-                bar_width = median_diff * width_factor
-                bar_width = min(bar_width, 86400 * 5 * width_factor)
-        elif len(self.main_plot_dates) == 1:
-            bar_width = 86400 * width_factor
-        else: # No data
-            bar_width = 0
-
-        volume_brush = mkBrush(0, 100, 150, 180) # Define volume bar color
-        volume_pen = mkPen(None) # No border on volume bars
-        self.volume_item = pg.BarGraphItem(
+        # Reuses bar_width computed for the candlesticks above
+        self.volume_item = VolumeBarsItem(
             x=self.main_plot_dates, height=volume_values, width=bar_width,
-            brush=volume_brush, pen=volume_pen
+            brush=self.VOLUME_BRUSH, pen=self.VOLUME_PEN
         )
         self.volume_plot.addItem(self.volume_item)
 
@@ -402,115 +834,340 @@ class ChartManager:
              # Fallback if no dates available
              self.price_plot.autoRange()
 
-        print("Main stock data plotted successfully (Candlestick & Volume).")
-        # logging.info(f"Finished plotting stock data for {ticker}")
+        logger.debug("Main stock data plotted successfully (Candlestick & Volume).")
 
-    def add_overlay_indicator(self, indicator_id: str, values: pd.Series, name: str, color='r', width=1):
+    def _pen(self, color, width) -> QtGui.QPen:
+        """Returns a cached pen for (color, width), creating it with mkPen on first use."""
+        key = (str(color), int(width))
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = mkPen(color, width=width)
+            pen.setCosmetic(True) # Width in pixels regardless of zoom (mkPen's default, made explicit)
+            self._pen_cache[key] = pen
+        return pen
+
+    def set_render_hints(self, downsample: bool = True, clip: bool = True, antialias: bool = False):
+        """
+        Sets how indicator curves are rendered, for existing and future curves.
+
+        Args:
+            downsample (bool): Automatically reduce curves to ~one point per pixel
+                               ('peak' mode, so spikes are kept).
+            clip (bool): Only process the points inside the visible X range.
+            antialias (bool): Antialias curve lines (slower on long series).
+        """
+        self._render_hints = {'downsample': downsample, 'clip': clip, 'antialias': antialias}
+        for indicator_id, plot_ref in self.indicator_plots.items():
+            curve = self._subplot_curves.get(indicator_id) if isinstance(plot_ref, pg.PlotItem) else plot_ref
+            if curve is not None:
+                self._configure_curve(curve)
+
+    def _configure_curve(self, indicator_curve: pg.PlotDataItem):
+        """Applies the shared rendering settings (set_render_hints) to an indicator curve."""
+        hints = self._render_hints
+        # Only draw ~one point per pixel (peak mode keeps extremes) and skip off-screen points
+        if hints['downsample']:
+            indicator_curve.setDownsampling(auto=True, method='peak')
+        else:
+            indicator_curve.setDownsampling(ds=1, auto=False)
+        indicator_curve.setClipToView(hints['clip'])
+        if indicator_curve.opts.get('antialias') != hints['antialias']:
+            indicator_curve.opts['antialias'] = hints['antialias']
+            indicator_curve.updateItems() # No public setter; pushes the option to the inner curve
+        # A device-pixel cache lets panning blit the rasterized line, but with downsampling
+        # or clip-to-view pyqtgraph re-sets the curve data on every view change, which
+        # throws the cache away each frame; then it only adds an offscreen render + blit.
+        # The cache lives on the inner PlotCurveItem, which does the actual painting.
+        if hints['downsample'] or hints['clip']:
+            cache_mode = QtWidgets.QGraphicsItem.CacheMode.NoCache
+        else:
+            cache_mode = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+        indicator_curve.curve.setCacheMode(cache_mode)
+
+    def _prepare_stock_arrays(self, data: pd.DataFrame) -> tuple:
+        """
+        Validates the stock DataFrame and extracts the arrays used for plotting.
+
+        Args:
+            data (pd.DataFrame): DataFrame with a DatetimeIndex and OHLCV columns.
+
+        Returns:
+            tuple: (timestamps, opens, highs, lows, closes, volumes) numpy arrays.
+
+        Raises:
+            ValueError: If the index is not a DatetimeIndex or columns are missing.
+        """
+        required_cols = ["Open", "High", "Low", "Close", "Volume"]
+        # Validate index type
+        if not isinstance(data.index, pd.DatetimeIndex):
+             raise ValueError("Data index must be a DatetimeIndex.")
+        # Validate required columns
+        if not all(col in data.columns for col in required_cols):
+            missing = [c for c in required_cols if c not in data.columns]
+            raise ValueError(f"Data is missing required columns: {missing}")
+
+        # Convert index to UTC timestamps (seconds since epoch) - consistent internal representation.
+        # DatetimeIndex.values is datetime64 in UTC for tz-aware indexes (naive indexes are
+        # treated as UTC), so its raw int64 ticks only need scaling to seconds. The scale
+        # follows the index's actual unit, since pandas may store it at a non-ns resolution.
+        timestamps = _datetime_values_to_seconds(data.index.values)
+
+        # Prepare column arrays for CandlestickItem and the volume bars. Each column is
+        # pulled out once as a float64 array (no per-row .iloc lookups or dicts); for
+        # float64 columns to_numpy returns a view rather than a copy.
+        opens = data['Open'].to_numpy(dtype=np.float64, copy=False)
+        highs = data['High'].to_numpy(dtype=np.float64, copy=False)
+        lows = data['Low'].to_numpy(dtype=np.float64, copy=False)
+        closes = data['Close'].to_numpy(dtype=np.float64, copy=False)
+        volume_values = data['Volume'].to_numpy(dtype=np.float64, copy=False)
+        return timestamps, opens, highs, lows, closes, volume_values
+
+    def update_price(self, data: pd.DataFrame, ticker: str):
+        """
+        Shows new stock data, reusing the existing price/volume plots when possible.
+
+        If the chart already has a price plot, the CandlestickItem and VolumeBarsItem
+        are updated in place with setData() instead of tearing down and recreating
+        every PlotItem. Indicators are left in place: the caller should re-add them
+        with values for the new data (which updates them in place via setData) or
+        remove them, since they no longer line up with the new timestamps.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing stock data (see plot_stock_data).
+            ticker (str): The stock ticker symbol for labeling.
+        """
+        if self.price_plot is None or self.candlestick_item is None or data is None or data.empty:
+            # Nothing to reuse (or nothing to show): build the chart from scratch
+            self.clear_chart()
+            self.plot_stock_data(data, ticker)
+            return
+
+        try:
+            dates, opens, highs, lows, closes, volume_values = self._prepare_stock_arrays(data)
+        except Exception as e:
+            logger.error("Error preparing stock data for plotting: %s", e)
+            self.clear_chart()
+            self.graphics_widget.addLabel(f"Error preparing data for {ticker}", row=0, col=0)
+            return
+
+        logger.debug("Updating main stock data for %s...", ticker)
+
+        self.ticker_label = ticker
+        self.main_plot_dates = dates
+        self.volume_values = volume_values
+        self._close_np = closes
+        self._mask_cache = {} # Cached alignments refer to the old dates
+
+        bar_width = _compute_bar_width(dates)
+        self.candlestick_item.setData(dates, opens, highs, lows, closes, width=bar_width)
+        self.volume_item.setData(dates, volume_values, bar_width)
+        self.price_plot.setTitle(f"{ticker} - Price and Indicators")
+
+        # Reset the view to the new data, same as a fresh plot
+        if len(dates) > 0:
+            self.price_plot.setXRange(dates[0], dates[-1], padding=0.02)
+            self.price_plot.enableAutoRange(axis='y', enable=True)
+            self.volume_plot.enableAutoRange(axis='y', enable=True)
+            # Cull candles to the new view now rather than on the next timer tick
+            self._view_range_timer.stop()
+            self._apply_candle_view_range()
+
+        logger.debug("Main stock data updated successfully (Candlestick & Volume).")
+
+    def remove_indicator(self, indicator_id: str):
+        """
+        Removes a single overlay curve or indicator subplot from the chart.
+
+        Args:
+            indicator_id (str): The identifier the indicator was added with.
+        """
+        plot_ref = self.indicator_plots.pop(indicator_id, None)
+        self.indicator_points.pop(indicator_id, None)
+        self._subplot_curves.pop(indicator_id, None)
+        if plot_ref is None:
+            return
+
+        logger.debug("Removing indicator: %s", indicator_id)
+        if isinstance(plot_ref, pg.PlotItem):
+            # Subplot: remove its whole PlotItem from the layout
+            self.graphics_widget.removeItem(plot_ref)
+            if plot_ref is self.bottom_plot:
+                # Hand the shared date axis to the lowest remaining plot
+                self.bottom_plot = self._lowest_plot()
+                if self.bottom_plot is not None:
+                    self.bottom_plot.showAxis('bottom')
+        elif self.price_plot is not None:
+            # Overlay: remove the curve (and its legend entry) from the price plot
+            self.price_plot.removeItem(plot_ref)
+
+    def _lowest_plot(self):
+        """Returns the PlotItem in the bottom-most layout row, or None if there are no plots."""
+        lowest, lowest_row = None, -1
+        for item, cells in self.graphics_widget.ci.items.items():
+            if isinstance(item, pg.PlotItem):
+                row = max(r for r, _ in cells)
+                if row > lowest_row:
+                    lowest, lowest_row = item, row
+        return lowest
+
+    def next_subplot_row(self) -> int:
+        """Returns the first free layout row below all existing plots (at least 2)."""
+        rows = [r for cells in self.graphics_widget.ci.items.values() for r, _ in cells]
+        return max(max(rows, default=1) + 1, 2)
+
+    def _on_price_x_range_changed(self, *args):
+        """Schedules a candle re-cull; repeated range changes within the interval are coalesced."""
+        if not self._view_range_timer.isActive():
+            self._view_range_timer.start()
+
+    def _apply_candle_view_range(self):
+        """Passes the current visible X range of the price plot to the CandlestickItem."""
+        if self.price_plot is None or self.candlestick_item is None:
+            return
+        x0, x1 = self.price_plot.viewRange()[0]
+        self.candlestick_item.set_view_range(x0, x1, self.price_plot.getViewBox().width())
+
+    def _align(self, values: pd.Series | np.ndarray, x: np.ndarray | None = None) -> tuple:
+        """
+        Aligns an indicator with main_plot_dates, dropping NaN/inf points.
+
+        Works on the raw float64 array in one pass (no isnull()/dropna() round
+        trips through pandas): one isfinite pass builds the mask, and when every
+        value is finite the arrays are returned as-is without copying. When only a
+        leading warm-up run is invalid, views of the tail are returned, so
+        indicators share main_plot_dates instead of each copying it. Callers
+        rely on this to plot with skipFiniteCheck=True.
+
+        Results are memoized per Series/array object (keyed by id, checked by identity
+        since the cache holds a reference), so aligning the same values again costs
+        nothing. The cache is reset whenever main_plot_dates changes.
+
+        Args:
+            values (pd.Series or np.ndarray): Indicator values aligned with main_plot_dates.
+            x (np.ndarray, optional): Precomputed X coordinates to use instead of main_plot_dates.
+
+        Returns:
+            tuple: (dates, values) ndarrays, or (None, None) if no value is finite.
+        """
+        cached = self._mask_cache.get(id(values))
+        if cached is not None and cached[0] is values and cached[1] is x:
+            return cached[2], cached[3]
+
+        dates = self.main_plot_dates if x is None else x
+
+        if isinstance(values, pd.Series):
+            arr = np.ascontiguousarray(values.to_numpy(dtype=np.float64, copy=False))
+        else:
+            arr = np.ascontiguousarray(values, dtype=np.float64)
+        valid_mask = np.isfinite(arr)
+        count = int(np.count_nonzero(valid_mask))
+        if count == 0:
+            result = (None, None)
+        elif count == arr.size:
+            result = (dates, arr) # Fast path: nothing to drop
+        elif count == arr.size - (first := int(valid_mask.argmax())):
+            # Only a leading warm-up run (typical for SMA/RSI) is invalid: zero-copy views
+            result = (dates[first:], arr[first:])
+        else:
+            result = (dates[valid_mask], arr[valid_mask])
+        self._mask_cache[id(values)] = (values, x, *result)
+        return result
+
+    def add_overlay_indicator(self, indicator_id: str, values: pd.Series | np.ndarray, name: str, color='r', width=1,
+                              pen: QtGui.QPen | None = None, x: np.ndarray | None = None):
         """
         Adds an indicator line plot as an overlay onto the main price chart (row 0).
 
+        If the indicator is already plotted, its existing curve is updated with
+        setData() instead of creating a new one.
+
         Args:
             indicator_id (str): A unique identifier for this indicator plot.
-            values (pd.Series): The indicator data Series, indexed matching the main stock data.
+            values (pd.Series or np.ndarray): The indicator values, one per bar of the main stock data.
             name (str): The name to display in the legend for this indicator.
             color (str or tuple): Color specification for the line (e.g., 'r', (255,0,0)).
             width (int): The width of the indicator line.
+            pen (QtGui.QPen, optional): Ready-made pen to use instead of color/width.
+            x (np.ndarray, optional): float64 epoch-second X values matching 'values' (see
+                                      index_to_epoch_seconds). Defaults to main_plot_dates.
         """
+        if pen is None:
+            pen = self._pen(color, width)
+
         # --- Pre-checks ---
         if self.price_plot is None:
-            print("Warning (Overlay): Cannot add overlay. Main price plot does not exist.")
-            # logging.warning(f"Overlay plot skipped ({name}): Main price plot missing.")
+            logger.warning("Overlay: Cannot add overlay. Main price plot does not exist.")
             return
-        if self.main_plot_dates is None or len(self.main_plot_dates) != len(values):
+        if self.main_plot_dates is None or len(self.main_plot_dates) != len(values) or (x is not None and len(x) != len(values)):
              # Check if lengths match - crucial for plotting against correct timestamps
-             print(f"Warning (Overlay {name}): Mismatched data lengths or missing main plot dates.")
-             # logging.warning(f"Overlay plot skipped ({name}): Data length mismatch.")
+             logger.warning("Overlay %s: Mismatched data lengths or missing main plot dates.", name)
+             self.remove_indicator(indicator_id) # Don't leave a stale curve behind
              return
-        if values.isnull().all():
+        # --- Prepare Data for Plotting (handle NaNs) ---
+        # Plot only where indicator values are not NaN
+        dates_to_plot, values_to_plot = self._align(values, x)
+        if dates_to_plot is None:
             # Don't plot if the indicator calculation resulted in all NaNs
-            print(f"Warning (Overlay {name}): All indicator values are NaN, skipping plot.")
-            # logging.warning(f"Overlay plot skipped ({name}): All values NaN.")
+            logger.warning("Overlay %s: All indicator values are NaN, skipping plot.", name)
+            self.remove_indicator(indicator_id)
             return
 
-        print(f"Adding overlay indicator: {name}")
-        # logging.info(f"Adding overlay indicator: {name}")
+        # --- Reuse an Existing Curve ---
+        indicator_curve = self.indicator_plots.get(indicator_id)
+        if indicator_curve is not None:
+            logger.debug("Updating overlay indicator: %s", name)
+            indicator_curve.setData(x=dates_to_plot, y=values_to_plot, connect='all', skipFiniteCheck=True)
+            indicator_curve.setPen(pen)
+            self.indicator_points[indicator_id] = (dates_to_plot, values_to_plot)
+            return
 
-        # --- Prepare Data for Plotting (handle NaNs) ---
-        # Plot only where indicator values are not NaN
-        valid_indices = ~values.isnull()
-        dates_to_plot = self.main_plot_dates[valid_indices]
-        values_to_plot = values.dropna().values # Get corresponding non-NaN values
-
-        # Check if any valid data remains after dropping NaNs
-        if len(dates_to_plot) == 0:
-             print(f"Warning (Overlay {name}): No valid (non-NaN) data points to plot.")
-             # logging.warning(f"Overlay plot skipped ({name}): No valid data points after NaN drop.")
-             return
+        logger.debug("Adding overlay indicator: %s", name)
 
         # --- Add Plot Curve ---
         # Use plot() method of the existing price PlotItem
         indicator_curve = self.price_plot.plot(
             x=dates_to_plot, y=values_to_plot,
-            pen=mkPen(color, width=width),
-            name=name # Name for the legend item
+            pen=pen,
+            name=name, # Name for the legend item
+            # _align() already dropped non-finite points, so skip pyqtgraph's own scan
+            connect='all', skipFiniteCheck=True
         )
+        self._configure_curve(indicator_curve)
         # Store a reference to the plotted curve (PlotDataItem)
         self.indicator_plots[indicator_id] = indicator_curve
+        self.indicator_points[indicator_id] = (dates_to_plot, values_to_plot)
 
-    def add_subplot_indicator(self, indicator_id: str, values: pd.Series, name: str, y_label: str, row_index: int, color='g', width=1):
+    def ensure_subplot(self, indicator_id: str, row_index: int, y_label: str, title: str | None = None) -> pg.PlotItem:
         """
-        Adds an indicator plot in its own subplot below the volume chart.
+        Returns the subplot PlotItem for an indicator, creating it if needed.
+
+        Existing subplots are reused as-is (only their X link is refreshed), so
+        updating an indicator does not recreate its PlotItem and axes.
 
         Args:
-            indicator_id (str): A unique identifier for this indicator plot.
-            values (pd.Series): The indicator data Series, indexed matching the main stock data.
-            name (str): The name/title for this indicator subplot.
+            indicator_id (str): A unique identifier for the indicator.
+            row_index (int): The layout row for a newly created subplot.
             y_label (str): The label for the Y-axis of the subplot.
-            row_index (int): The row index in the GraphicsLayoutWidget for this subplot.
-                             Should start from 2 (row 0 = Price, row 1 = Volume).
-            color (str or tuple): Color specification for the line.
-            width (int): The width of the indicator line.
-        """
-         # --- Pre-checks ---
-        if self.price_plot is None: # Need price plot to link X-axis
-             print("Warning (Subplot): Cannot add subplot. Main price plot does not exist.")
-             # logging.warning(f"Subplot skipped ({name}): Main price plot missing.")
-             return
-        if self.main_plot_dates is None or len(self.main_plot_dates) != len(values):
-             print(f"Warning (Subplot {name}): Mismatched data lengths or missing main plot dates.")
-             # logging.warning(f"Subplot skipped ({name}): Data length mismatch.")
-             return
-        if values.isnull().all():
-            print(f"Warning (Subplot {name}): All indicator values are NaN, skipping plot.")
-            # logging.warning(f"Subplot skipped ({name}): All values NaN.")
-            return
-
-        print(f"Adding subplot indicator: {name} at row {row_index}")
-        # logging.info(f"Adding subplot indicator: {name} at row {row_index}")
-
-        # --- Prepare Data for Plotting (handle NaNs) ---
-        valid_indices = ~values.isnull()
-        dates_to_plot = self.main_plot_dates[valid_indices]
-        values_to_plot = values.dropna().values
+            title (str, optional): Title for a newly created subplot.
 
-        if len(dates_to_plot) == 0:
-             print(f"Warning (Subplot {name}): No valid (non-NaN) data points to plot.")
-             # logging.warning(f"Subplot skipped ({name}): No valid data points after NaN drop.")
-             return
+        Returns:
+            pg.PlotItem: The indicator's subplot.
+        """
+        indicator_plot_item = self.indicator_plots.get(indicator_id)
+        if isinstance(indicator_plot_item, pg.PlotItem):
+            indicator_plot_item.setXLink(self.price_plot)
+            return indicator_plot_item
 
+        logger.debug("Creating subplot for %s at row %s", indicator_id, row_index)
         # --- Create New PlotItem for the Subplot ---
-        date_axis = DateAxisItem(orientation='bottom') # Separate date axis for each subplot
+        # All X axes are linked, so date labels are only needed on the bottom-most plot.
+        # The new subplot becomes the bottom plot; the previous one hides its date axis.
+        # (Each PlotItem needs its own axis item; they can't be shared between plots.)
+        date_axis = CachedDateAxisItem(orientation='bottom')
         indicator_plot_item = self.graphics_widget.addPlot(
             row=row_index, col=0,
             axisItems={'bottom': date_axis},
-            title=name # Set subplot title directly
-        )
-
-        # --- Plot Indicator Data ---
-        indicator_curve = indicator_plot_item.plot(
-            x=dates_to_plot, y=values_to_plot,
-            pen=mkPen(color, width=width)
-            # No name needed here as title is set on PlotItem
+            title=title # Set subplot title directly
         )
 
         # --- Customize Subplot ---
@@ -521,8 +1178,74 @@ class ChartManager:
         # --- Link X Axis to Main Plot ---
         indicator_plot_item.setXLink(self.price_plot) # Link panning/zooming
 
+        # --- Move the Shared Date Axis Down ---
+        if self.bottom_plot is not None:
+            self.bottom_plot.hideAxis('bottom')
+        self.bottom_plot = indicator_plot_item
+
         # Store a reference to the created PlotItem
         self.indicator_plots[indicator_id] = indicator_plot_item
+        return indicator_plot_item
+
+    def add_subplot_indicator(self, indicator_id: str, values: pd.Series | np.ndarray, name: str, y_label: str, row_index: int, color='g', width=1,
+                              pen: QtGui.QPen | None = None, x: np.ndarray | None = None):
+        """
+        Adds an indicator plot in its own subplot below the volume chart.
+
+        If the indicator already has a subplot, both the PlotItem and its curve
+        are reused and the curve is updated with setData().
+
+        Args:
+            indicator_id (str): A unique identifier for this indicator plot.
+            values (pd.Series or np.ndarray): The indicator values, one per bar of the main stock data.
+            name (str): The name/title for this indicator subplot.
+            y_label (str): The label for the Y-axis of the subplot.
+            row_index (int): The row index in the GraphicsLayoutWidget for a new subplot.
+                             Should start from 2 (row 0 = Price, row 1 = Volume).
+            color (str or tuple): Color specification for the line.
+            width (int): The width of the indicator line.
+            pen (QtGui.QPen, optional): Ready-made pen to use instead of color/width.
+            x (np.ndarray, optional): float64 epoch-second X values matching 'values' (see
+                                      index_to_epoch_seconds). Defaults to main_plot_dates.
+        """
+        if pen is None:
+            pen = self._pen(color, width)
+
+         # --- Pre-checks ---
+        if self.price_plot is None: # Need price plot to link X-axis
+             logger.warning("Subplot: Cannot add subplot. Main price plot does not exist.")
+             return
+        if self.main_plot_dates is None or len(self.main_plot_dates) != len(values) or (x is not None and len(x) != len(values)):
+             logger.warning("Subplot %s: Mismatched data lengths or missing main plot dates.", name)
+             self.remove_indicator(indicator_id) # Don't leave a stale subplot behind
+             return
+        # --- Prepare Data for Plotting (handle NaNs) ---
+        dates_to_plot, values_to_plot = self._align(values, x)
+        if dates_to_plot is None:
+            logger.warning("Subplot %s: All indicator values are NaN, skipping plot.", name)
+            self.remove_indicator(indicator_id)
+            return
+
+        indicator_plot_item = self.ensure_subplot(indicator_id, row_index, y_label, title=name)
+
+        # --- Plot Indicator Data (reusing the curve if there is one) ---
+        indicator_curve = self._subplot_curves.get(indicator_id)
+        if indicator_curve is not None:
+            logger.debug("Updating subplot indicator: %s", name)
+            indicator_curve.setData(x=dates_to_plot, y=values_to_plot, connect='all', skipFiniteCheck=True)
+            indicator_curve.setPen(pen)
+        else:
+            logger.debug("Adding subplot indicator: %s at row %s", name, row_index)
+            indicator_curve = indicator_plot_item.plot(
+                x=dates_to_plot, y=values_to_plot,
+                pen=pen,
+                # No name needed here as title is set on PlotItem
+                connect='all', skipFiniteCheck=True
+            )
+            self._configure_curve(indicator_curve)
+            self._subplot_curves[indicator_id] = indicator_curve
+
+        self.indicator_points[indicator_id] = (dates_to_plot, values_to_plot)
 
 
     def update_crosshair(self, timestamp: float, price: float):
@@ -545,25 +1268,41 @@ class ChartManager:
          """
          Sets the visible X-axis range for all linked plots.
 
-         Also re-enables Y-axis autoranging for all plots to adjust their
-         vertical view based on the data visible in the new X-range.
+         The Y range of each plot is set directly from the min/max of the data
+         inside the new X-range. The bounds come from a binary search on the sorted
+         timestamps, so only the visible slice is scanned instead of letting
+         auto-range traverse every item's full data.
 
          Args:
             start_ts (float): The starting Unix timestamp for the view.
             end_ts (float): The ending Unix timestamp for the view.
          """
          if self.price_plot:
-             print(f"Setting view range: {start_ts} to {end_ts}")
+             logger.debug("Setting view range: %s to %s", start_ts, end_ts)
              # Set X range with a small padding
              self.price_plot.setXRange(start_ts, end_ts, padding=0.01)
 
-             # Re-enable Y auto-ranging for all plots after changing X range
-             # This allows the Y axis to adapt to the visible data
-             self.price_plot.enableAutoRange(axis='y', enable=True)
-             if self.volume_plot:
-                 self.volume_plot.enableAutoRange(axis='y', enable=True)
-             # Re-enable for all indicator subplots as well
-             for plot_ref in self.indicator_plots.values():
-                 if isinstance(plot_ref, pg.PlotItem): # Check if it's a subplot PlotItem
-                     plot_ref.enableAutoRange(axis='y', enable=True)
-                 # Note: Overlay curves (PlotDataItems) don't have their own Y range setting
\ No newline at end of file
+             # Price plot: candle lows/highs plus any overlay indicators
+             if self.candlestick_item is not None:
+                 item = self.candlestick_item
+                 y_range = _visible_y_range(item.ts, item.lows, item.highs, start_ts, end_ts)
+                 for indicator_id, (dates, values) in self.indicator_points.items():
+                     if self.indicator_plots.get(indicator_id) is not None and \
+                             not isinstance(self.indicator_plots[indicator_id], pg.PlotItem):
+                         y_range = _merge_ranges(y_range, _visible_y_range(dates, values, values, start_ts, end_ts))
+                 if y_range is not None:
+                     self.price_plot.setYRange(*y_range, padding=0.05)
+
+             # Volume plot: bars start at zero
+             if self.volume_plot and self.volume_values is not None:
+                 y_range = _visible_y_range(self.main_plot_dates, self.volume_values, self.volume_values, start_ts, end_ts)
+                 if y_range is not None:
+                     self.volume_plot.setYRange(min(y_range[0], 0.0), y_range[1], padding=0.05)
+
+             # Indicator subplots
+             for indicator_id, plot_ref in self.indicator_plots.items():
+                 if isinstance(plot_ref, pg.PlotItem) and indicator_id in self.indicator_points:
+                     dates, values = self.indicator_points[indicator_id]
+                     y_range = _visible_y_range(dates, values, values, start_ts, end_ts)
+                     if y_range is not None:
+                         plot_ref.setYRange(*y_range, padding=0.05)
\ No newline at end of file
@@ -1,26 +1,215 @@
 # data_fetcher.py
 
-import yfinance as yf
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+from PySide6.QtCore import QStandardPaths
 import logging # Optional: Use logging for more structured output
 
-# Setup basic logging if you want more detail than print statements
+# Logging is configured in finance_app.main(); uncomment to use this module standalone
 # logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+logger = logging.getLogger(__name__)
+
 class DataFetcher:
     """
     Handles fetching historical stock data using the yfinance library.
 
     Provides a method to retrieve OHLCV data for a given ticker, period, and interval,
     performing basic validation and error handling.
+
+    Successful fetches are cached in two tiers keyed on (ticker, period, interval, date):
+    a small in-process LRU and .npz files in the user's cache directory. How long a
+    result stays fresh depends on the interval (CACHE_TTL_BY_INTERVAL): finer bars
+    change sooner, weekly and longer bars are reused for the rest of the day.
+    Returned DataFrames may be shared with the cache, so callers must not modify them.
     """
+    # Seconds a cached result stays fresh, per interval. None = until the date changes.
+    CACHE_TTL_BY_INTERVAL = {
+        "1m": 30, "2m": 30, "5m": 60, "15m": 120, "30m": 300,
+        "60m": 600, "90m": 600, "1h": 600,
+        "1d": 3600, "5d": 3600, # Today's bar is still forming during market hours
+        "1wk": None, "1mo": None, "3mo": None,
+    }
+    INTRADAY_CACHE_TTL = 5 * 60     # Fallback for minute/hour intervals not in the table
+    DISK_CACHE_MAX_AGE = 24 * 3600  # Older cache files are deleted on startup
+    MEMORY_CACHE_SIZE = 32          # Max entries kept in the in-process tier
+
     def __init__(self):
         """
-        Initializes the DataFetcher.
-        Currently, no specific configuration is needed at initialization.
+        Initializes the DataFetcher and its cache directory.
         """
-        print("DataFetcher initialized.")
-        # logging.info("DataFetcher initialized.")
+        self._memory_cache = OrderedDict() # {key: (stored_at, DataFrame)}, most recent last
+        self._memory_lock = threading.Lock() # Fetches run on pool threads
+        self._cache_dir = self._open_cache_dir()
+        if self._cache_dir is not None:
+            self._prune_disk_cache()
+        logger.debug("DataFetcher initialized.")
+
+    @staticmethod
+    def _open_cache_dir() -> Path | None:
+        """
+        Creates (if needed) and checks the per-user disk cache directory.
+
+        The directory lives under the user's cache location (not the shared temp
+        directory) and must be a real directory owned by the current user and not
+        accessible to anyone else; otherwise the disk tier is disabled.
+
+        Returns:
+            Path | None: The cache directory, or None if the disk cache is unavailable.
+        """
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+        if not base:
+            logger.warning("Disk cache unavailable (no user cache location).")
+            return None
+        cache_dir = Path(base) / "toktik"
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if cache_dir.is_symlink() or not cache_dir.is_dir():
+                raise OSError(f"{cache_dir} is not a plain directory")
+            if hasattr(os, "getuid"): # POSIX: ownership and permission bits are meaningful
+                st = cache_dir.stat()
+                if st.st_uid != os.getuid():
+                    raise OSError(f"{cache_dir} is owned by another user")
+                if st.st_mode & 0o077:
+                    cache_dir.chmod(0o700)
+        except OSError as e:
+            logger.warning("Disk cache unavailable (%s).", e)
+            return None
+        return cache_dir
+
+    def _prune_disk_cache(self):
+        """Deletes cache files older than DISK_CACHE_MAX_AGE."""
+        cutoff = time.time() - self.DISK_CACHE_MAX_AGE
+        for path in self._cache_dir.glob("*.npz"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass # Another instance may have removed it already
+
+    @staticmethod
+    def _is_intraday(interval: str) -> bool:
+        """True for minute/hour intervals ("1m", "90m", "1h"), False for "1d", "1wk", "1mo", ..."""
+        return interval.endswith(("m", "h")) and not interval.endswith("mo")
+
+    def _cache_ttl(self, interval: str) -> float | None:
+        """Max age in seconds of a cached result, or None if it is valid for the whole day."""
+        if interval in self.CACHE_TTL_BY_INTERVAL:
+            return self.CACHE_TTL_BY_INTERVAL[interval]
+        return self.INTRADAY_CACHE_TTL if self._is_intraday(interval) else None
+
+    def _get_cached(self, key: tuple, ttl: float | None) -> pd.DataFrame | None:
+        """Looks a key up in the memory tier, then on disk. Returns None on a miss."""
+        now = time.time()
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                stored_at, data = entry
+                if ttl is None or now - stored_at < ttl:
+                    self._memory_cache.move_to_end(key)
+                    return data
+                del self._memory_cache[key]
+
+        if self._cache_dir is None:
+            return None
+        path = self._cache_path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if ttl is not None and now - stored_at >= ttl:
+                return None
+            data = self._load_frame(path)
+        except Exception:
+            return None # Missing, expired or unreadable file: treat as a miss
+        self._remember(key, data, stored_at)
+        return data
+
+    def _remember(self, key: tuple, data: pd.DataFrame, stored_at: float):
+        """Adds an entry to the memory tier, evicting the least recently used one if full."""
+        with self._memory_lock:
+            self._memory_cache[key] = (stored_at, data)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _store(self, key: tuple, data: pd.DataFrame):
+        """Saves a fetched result in both cache tiers (disk errors are not fatal)."""
+        self._remember(key, data, time.time())
+        if self._cache_dir is None:
+            return
+        path = self._cache_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                self._save_frame(f, data)
+            tmp_path.replace(path) # Atomic, so readers never see a half-written file
+        except (OSError, ValueError) as e: # ValueError: a column numpy can't store without pickle
+            logger.warning("Could not write cache file %s: %s", path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _save_frame(file, data: pd.DataFrame):
+        """
+        Writes an OHLCV DataFrame as a plain .npz archive (no pickled objects).
+
+        Each column is stored as its own array so dtypes survive; the DatetimeIndex
+        is stored as UTC integer ticks plus its resolution and time zone name.
+
+        Args:
+            file: Binary file object to write to.
+            data (pd.DataFrame): Data with a DatetimeIndex and numeric columns.
+
+        Raises:
+            ValueError: If a column has a dtype that would need pickling.
+        """
+        columns = {}
+        for i, name in enumerate(data.columns):
+            values = data[name].to_numpy()
+            if values.dtype.hasobject:
+                raise ValueError(f"column {name!r} has object dtype")
+            columns[f"col_{i}"] = values
+        index = data.index
+        np.savez(
+            file,
+            index=index.asi8,
+            unit=np.array(index.unit),
+            tz=np.array(str(index.tz) if index.tz is not None else ""),
+            index_name=np.array(index.name or ""),
+            columns=np.array([str(name) for name in data.columns]),
+            **columns,
+        )
+
+    @staticmethod
+    def _load_frame(path: Path) -> pd.DataFrame:
+        """
+        Reads a DataFrame written by _save_frame. Pickled content is refused.
+
+        Args:
+            path (Path): The .npz cache file.
+
+        Returns:
+            pd.DataFrame: The cached data.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            index = pd.DatetimeIndex(archive["index"].view(f"datetime64[{archive['unit']}]"))
+            tz = str(archive["tz"])
+            if tz:
+                index = index.tz_localize("UTC").tz_convert(tz)
+            index.name = str(archive["index_name"]) or None
+            names = archive["columns"].tolist()
+            return pd.DataFrame({name: archive[f"col_{i}"] for i, name in enumerate(names)}, index=index)
+
+    def _cache_path(self, key: tuple) -> Path:
+        """Returns the disk cache file for a key."""
+        digest = hashlib.sha1("|".join(key).encode()).hexdigest()
+        return self._cache_dir / f"{digest}.npz"
 
     def fetch_stock_data(self, ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
         """
@@ -49,10 +238,39 @@ class DataFetcher:
         if not ticker:
             raise ValueError("Ticker symbol cannot be empty.")
 
-        print(f"Attempting to fetch data for {ticker} (Period: {period}, Interval: {interval})")
-        # logging.info(f"Fetching data: Ticker={ticker}, Period={period}, Interval={interval}")
+        key = (ticker, period, interval, date.today().isoformat())
+        cached = self._get_cached(key, self._cache_ttl(interval))
+        if cached is not None:
+            logger.debug("Using cached data for %s (Period: %s, Interval: %s).", ticker, period, interval)
+            return cached
+
+        data = self._download(ticker, period, interval)
+        if not data.empty:
+            self._store(key, data)
+        return data
+
+    def _download(self, ticker: str, period: str, interval: str) -> pd.DataFrame:
+        """
+        Downloads and cleans data from yfinance (the uncached part of fetch_stock_data).
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            period (str): The period for which to fetch data.
+            interval (str): The data interval / frequency.
+
+        Returns:
+            pd.DataFrame: The cleaned OHLCV data, or an empty DataFrame if none was found.
+
+        Raises:
+            ValueError: If fetching or processing fails.
+        """
+        logger.debug("Attempting to fetch data for %s (Period: %s, Interval: %s)", ticker, period, interval)
 
         try:
+            # yfinance (and requests, lxml, ... behind it) is imported on first download
+            # rather than at startup; later calls hit the sys.modules cache.
+            import yfinance as yf
+
             # Instantiate the yfinance Ticker object
             stock_ticker = yf.Ticker(ticker)
 
@@ -63,32 +281,32 @@ class DataFetcher:
             if data.empty:
                 # It's common for yfinance to return empty if the ticker is valid but has no data for the period/interval.
                 # We'll return the empty DataFrame and let the caller decide how to handle it (e.g., show a message).
-                print(f"Warning: No data returned by yfinance for ticker '{ticker}' with period='{period}', interval='{interval}'.")
-                # logging.warning(f"No data returned for Ticker={ticker}, Period={period}, Interval={interval}")
+                logger.warning("No data returned by yfinance for ticker '%s' with period='%s', interval='%s'.", ticker, period, interval)
                 return pd.DataFrame() # Return empty DataFrame explicitly
 
             # --- Data Cleaning (Optional but recommended) ---
             # 1. Check for required columns (yfinance usually provides them, but good practice)
             required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in data.columns for col in required_cols):
-                 missing_cols = [col for col in required_cols if col not in data.columns]
+            missing_cols = set(required_cols).difference(data.columns)
+            if missing_cols:
                  # Raise an error here as this indicates unexpected data format
-                 raise ValueError(f"Fetched data for '{ticker}' is missing required columns: {missing_cols}")
+                 raise ValueError(f"Fetched data for '{ticker}' is missing required columns: {sorted(missing_cols)}")
 
             # 2. Handle potential NaNs (though yfinance data is often quite clean)
             #    Decide on strategy: forward-fill, backward-fill, drop, or leave them.
             #    Dropping rows might be simplest if NaNs are rare.
+            #    One isfinite pass over the OHLCV block builds the row mask (this also drops
+            #    +/-inf, which the plotting code never expects to see).
             initial_rows = len(data)
-            data.dropna(subset=required_cols, inplace=True)
-            rows_after_na = len(data)
+            valid_rows = np.isfinite(data[required_cols].to_numpy(dtype=np.float64)).all(axis=1)
+            rows_after_na = int(valid_rows.sum())
             if initial_rows != rows_after_na:
-                print(f"Note: Dropped {initial_rows - rows_after_na} rows with NaN values in OHLCV columns for {ticker}.")
-                # logging.info(f"Dropped {initial_rows - rows_after_na} NaN rows for {ticker}")
+                data = data.loc[valid_rows]
+                logger.info("Dropped %s rows with NaN/inf values in OHLCV columns for %s.", initial_rows - rows_after_na, ticker)
 
             if data.empty:
                  # If all rows had NaNs after fetching
-                 print(f"Warning: Data for '{ticker}' became empty after removing NaN values.")
-                 # logging.warning(f"Data empty after NaN removal for {ticker}")
+                 logger.warning("Data for '%s' became empty after removing NaN values.", ticker)
                  return pd.DataFrame()
 
 
@@ -98,16 +316,14 @@ class DataFetcher:
                 # This would be highly unusual for yfinance, indicates a problem.
                 raise TypeError(f"Data index for '{ticker}' is not a DatetimeIndex. Type: {type(data.index)}")
 
-            print(f"Successfully fetched and cleaned {len(data)} data points for {ticker}.")
-            # logging.info(f"Successfully fetched {len(data)} points for {ticker}")
+            logger.debug("Successfully fetched and cleaned %s data points for %s.", len(data), ticker)
             return data
 
         except Exception as e:
             # Catch potential errors from yfinance (e.g., network issues, invalid ticker format issues)
             # or errors from our cleaning steps.
             error_message = f"Error fetching or processing data for '{ticker}' (Period: {period}, Interval: {interval}): {e}"
-            print(error_message)
-            # logging.error(error_message, exc_info=True) # Log full traceback if using logging
+            logger.error(error_message, exc_info=True)
 
             # Re-raise as a ValueError to signal a fetch/processing problem to the caller.
             # Include the original error message for context.
@@ -2,25 +2,155 @@
 
 """
 Main application controller module for Ava's Awesome Finance App.
+
+pandas, pyqtgraph, numba and the modules built on them are imported where they
+are first used (FinanceApp.__init__ / main) rather than at module load, so the
+QApplication can start before those imports are paid for.
 """
 
+from __future__ import annotations
+
+import os
 import sys
-import pandas as pd
+from typing import TYPE_CHECKING
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QMessageBox, QStatusBar
 )
-from PySide6.QtGui import QColor # Needed for pg config
-from PySide6.QtCore import Qt
-import pyqtgraph as pg
+from PySide6.QtGui import QColor, QPen # QColor is also needed for pg config
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, Signal
 import logging
 
 # --- Import Modular Components ---
-# Import UI builder and theme function
+# Import UI builder and theme function (pyqtgraph is only imported inside AppUI.setup_ui)
 from ui_manager import AppUI, apply_dark_theme
-# Import core logic components
-from data_fetcher import DataFetcher
-from chart_manager import ChartManager
-from indicator_calculator import IndicatorCalculator
+# Core logic components are imported lazily; these are for annotations only
+if TYPE_CHECKING:
+    import pandas as pd
+    from data_fetcher import DataFetcher
+    from indicator_calculator import IndicatorCalculator
+
+
+def _cosmetic_pen(color: str, width: int) -> QPen:
+    """Returns a cosmetic QPen (width in pixels, independent of zoom), like pg.mkPen(..., cosmetic=True)."""
+    pen = QPen(QColor(color))
+    pen.setWidth(width)
+    pen.setCosmetic(True)
+    return pen
+
+
+# Supported indicator types: where each is plotted and which IndicatorCalculator methods
+# compute it (one period, or several periods of the same type in one pass).
+# Methods are named rather than referenced since indicator_calculator is imported lazily.
+INDICATOR_SPECS = {
+    'SMA': {'plot_type': 'overlay', 'calculate': 'calculate_sma_array', 'calculate_many': 'calculate_smas_array'},
+    'RSI': {'plot_type': 'subplot', 'calculate': 'calculate_rsi_array', 'calculate_many': 'calculate_rsis_array'},
+}
+
+
+# ---- Background Data Fetching ----
+class FetchWorkerSignals(QObject):
+    """
+    Signals emitted by FetchWorker (QRunnable cannot emit signals itself).
+
+    finished: (DataFrame, ticker, period, interval, request_id) on success.
+    failed: (exception, ticker, period, interval, request_id) if the fetch raised.
+    """
+    finished = Signal(object, str, str, str, int)
+    failed = Signal(object, str, str, str, int)
+
+
+class FetchWorker(QRunnable):
+    """
+    Runs DataFetcher.fetch_stock_data on a QThreadPool thread.
+
+    Results are delivered through self.signals; the connected FinanceApp slots
+    run on the GUI thread (queued connection), so they may touch widgets.
+    """
+    def __init__(self, data_fetcher: DataFetcher, ticker: str, period: str, interval: str, request_id: int):
+        super().__init__()
+        self.data_fetcher = data_fetcher
+        self.ticker = ticker
+        self.period = period
+        self.interval = interval
+        self.request_id = request_id # Passed back so results of superseded requests can be recognised
+        self.signals = FetchWorkerSignals()
+
+    def run(self):
+        """Fetches the data and emits finished or failed."""
+        try:
+            data = self.data_fetcher.fetch_stock_data(self.ticker, period=self.period, interval=self.interval)
+        except Exception as e:
+            self.signals.failed.emit(e, self.ticker, self.period, self.interval, self.request_id)
+            return
+        self.signals.finished.emit(data, self.ticker, self.period, self.interval, self.request_id)
+
+
+# ---- Background Indicator Calculation ----
+class IndicatorWorkerSignals(QObject):
+    """
+    Signals emitted by IndicatorWorker.
+
+    finished: ({indicator_id: np.ndarray}, DataFrame the values were calculated from).
+    An indicator that could not be calculated maps to an empty array.
+    """
+    finished = Signal(object, object)
+
+
+class IndicatorWorker(QRunnable):
+    """
+    Calculates indicators from a close array on a QThreadPool thread.
+
+    Only the calculation runs here; the FinanceApp slot connected to
+    signals.finished does the chart updates on the GUI thread.
+    """
+    def __init__(self, calculator: IndicatorCalculator, close: np.ndarray, configs: dict, source_data: pd.DataFrame):
+        super().__init__()
+        self.calculator = calculator
+        self.close = close
+        self.configs = configs # {indicator_id: config} to calculate
+        self.source_data = source_data # Passed back so stale results can be recognised
+        self.signals = IndicatorWorkerSignals()
+
+    def run(self):
+        """Calculates every configured indicator and emits finished with the results."""
+        # Several periods of one type are calculated together (e.g. SMAs share one pass
+        # over the close array, RSIs share their gains/losses)
+        results = {}
+        try:
+            periods_by_type = {}
+            for config in self.configs.values():
+                periods_by_type.setdefault(config['type'], set()).add(config['params']['period'])
+            batched = {}
+            for indicator_type, periods in periods_by_type.items():
+                spec = INDICATOR_SPECS.get(indicator_type)
+                if spec is not None and len(periods) > 1:
+                    try:
+                        batched[indicator_type] = getattr(self.calculator, spec['calculate_many'])(self.close, periods)
+                    except Exception as e:
+                        # Fall back to calculating each period on its own below
+                        print(f"Error batch-calculating {indicator_type}{sorted(periods)}: {e}")
+
+            for indicator_id, config in self.configs.items():
+                indicator_type = config['type']
+                period = config['params']['period']
+                spec = INDICATOR_SPECS.get(indicator_type)
+                values = None
+                try:
+                    if spec is not None:
+                        values = batched.get(indicator_type, {}).get(period)
+                        if values is None:
+                            values = getattr(self.calculator, spec['calculate'])(self.close, period)
+                except Exception as e:
+                    print(f"Error calculating indicator {indicator_id}: {e}")
+                results[indicator_id] = values if values is not None else np.empty(0, dtype=np.float64)
+        finally:
+            # Always report back, even after an unexpected error: the GUI thread tracks
+            # these ids as in flight until finished arrives
+            for indicator_id in self.configs:
+                results.setdefault(indicator_id, np.empty(0, dtype=np.float64))
+            self.signals.finished.emit(results, self.source_data)
+
 
 # ---- Main Application Window (Controller) ----
 class FinanceApp(QMainWindow):
@@ -29,8 +159,19 @@ class FinanceApp(QMainWindow):
 
     Orchestrates UI, data fetching, indicator calculation, and plotting.
     """
+    # Indicator line pens by indicator type, built once and shared by every plotted curve
+    INDICATOR_PENS = {
+        'sma': _cosmetic_pen('orange', 2),
+        'rsi': _cosmetic_pen('cyan', 1),
+        'default': _cosmetic_pen('purple', 2),
+    }
+
     def __init__(self):
         """Initializes the FinanceApp."""
+        # Deferred imports: these pull in pandas/pyqtgraph/numba (see module docstring)
+        from data_fetcher import DataFetcher
+        from chart_manager import ChartManager
+        from indicator_calculator import IndicatorCalculator
         super().__init__()
         self.setWindowTitle("Ava's Pro Finance App")
         self.resize(1200, 800)
@@ -41,10 +182,19 @@ class FinanceApp(QMainWindow):
         self.chart_manager = None # Initialized after UI
 
         # Initialize application state
+        self._data_is_valid: bool = False # current_data is non-empty; kept in sync by the current_data setter
         self.current_data: pd.DataFrame | None = None
         self.current_ticker: str = ""
-        self.indicators_config: list = []
+        self.indicators_config: dict = {} # {indicator_id: config}, in the order added
         self.indicator_results: dict = {}
+        self._plotted_data: pd.DataFrame | None = None # DataFrame currently shown by the chart
+        self._results_data: pd.DataFrame | None = None # DataFrame indicator_results were computed from
+        self._close_np: np.ndarray | None = None # Close prices of _results_data as float64
+        self._x_epoch: np.ndarray | None = None # Plot X values (epoch seconds) of _results_data
+        self._fetch_counter: int = 0 # Sequence number of the most recently started fetch
+        self._pending_fetch: int | None = None # Sequence number of the in-flight fetch (None once it is handled)
+        self._indicator_data: dict = {} # {indicator_id: DataFrame its plotted curve was calculated from}
+        self._calc_in_flight: set = set() # Indicator ids an IndicatorWorker is calculating for _results_data
 
         # Build the UI using the dedicated AppUI class from ui_manager
         # AppUI takes care of creating widgets and layouts
@@ -53,6 +203,19 @@ class FinanceApp(QMainWindow):
 
         # Initialize ChartManager using the graphics_widget created by AppUI
         self.chart_manager = ChartManager(self.ui.graphics_widget)
+        self.chart_manager.set_render_hints(downsample=True, clip=True, antialias=False)
+
+        # Coalesces bursts of indicator changes into a single recalculation/replot
+        self._replot_timer = QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(50)
+        self._replot_timer.timeout.connect(self._recalculate_and_plot_all)
+
+        # Coalesces rapid period changes (e.g. arrow-key cycling) into one interval list rebuild
+        self._interval_update_timer = QTimer(self)
+        self._interval_update_timer.setSingleShot(True)
+        self._interval_update_timer.setInterval(80)
+        self._interval_update_timer.timeout.connect(self._update_interval_options)
 
         # Setup Status Bar
         self.status_bar = QStatusBar()
@@ -66,54 +229,63 @@ class FinanceApp(QMainWindow):
 
         print("FinanceApp (Controller) initialized successfully!")
 
+    @property
+    def current_data(self) -> pd.DataFrame | None:
+        """The stock data currently shown (None if nothing has been fetched)."""
+        return self._current_data
+
+    @current_data.setter
+    def current_data(self, data: pd.DataFrame | None):
+        # Check emptiness once per assignment so the slots only test a flag
+        self._current_data = data
+        self._data_is_valid = data is not None and not data.empty
+
     def _connect_signals(self):
         """Connects UI signals to slots."""
         # Access UI elements via self.ui instance
         self.ui.fetch_button.clicked.connect(self._request_fetch_and_plot)
         self.ui.ticker_input.returnPressed.connect(self._request_fetch_and_plot)
-        self.ui.period_combo.currentTextChanged.connect(self._update_interval_options)
+        # start() restarts a running timer, so only the last change in a burst triggers an update
+        self.ui.period_combo.currentTextChanged.connect(self._interval_update_timer.start)
         self.ui.add_indicator_button.clicked.connect(self._handle_add_indicator_request)
         print("Signal connections established.")
 
     def _update_interval_options(self):
         """Updates the available intervals based on the selected period."""
         # Get necessary constants/maps from the UI manager
-        interval_map = self.ui.get_interval_map()
-        valid_intervals_list = self.ui.get_valid_intervals()
         default_interval_const = self.ui.get_default_interval()
 
         selected_period = self.ui.period_combo.currentText()
-        current_interval = self.ui.interval_combo.currentText()
-        self.ui.interval_combo.clear()
-
-        allowed_intervals = []
-        # Determine allowed intervals based on selected period
-        if selected_period in ["1y", "2y", "5y", "10y", "max"]:
-            allowed_intervals.extend(interval_map["daily_weekly"])
-            allowed_intervals.extend(interval_map["monthly"])
-        elif selected_period in ["6mo", "ytd"]:
-            allowed_intervals.extend(interval_map["intraday_medium"])
-            allowed_intervals.extend(interval_map["daily_weekly"])
-            allowed_intervals.extend(interval_map["monthly"])
-        elif selected_period in ["1mo", "3mo"]:
-            allowed_intervals.extend(interval_map["intraday_short"])
-            allowed_intervals.extend(interval_map["intraday_medium"])
-            allowed_intervals.extend(interval_map["daily_weekly"])
-        else: # 1d, 5d
-            allowed_intervals.extend(interval_map["intraday_short"])
-            allowed_intervals.extend(interval_map["intraday_medium"])
-
-        # Sort intervals based on typical order (e.g., minutes, hours, days, weeks)
-        unique_intervals = sorted(list(set(allowed_intervals)), key=lambda x: (valid_intervals_list.index(x) if x in valid_intervals_list else 999))
-        self.ui.interval_combo.addItems(unique_intervals)
-
-        # Restore previous selection or set default
-        if current_interval in unique_intervals:
-            self.ui.interval_combo.setCurrentText(current_interval)
-        elif default_interval_const in unique_intervals:
-             self.ui.interval_combo.setCurrentText(default_interval_const)
-        elif unique_intervals:
-             self.ui.interval_combo.setCurrentIndex(0)
+        combo = self.ui.interval_combo
+        current_interval = combo.currentText()
+
+        # Allowed intervals for the period, already de-duplicated and sorted (minutes, hours, days, ...)
+        unique_intervals = self.ui.get_intervals_for_period(selected_period)
+        # Periods allowing the same intervals share one list model, built once by the UI
+        interval_model = self.ui.get_interval_model(selected_period)
+        if combo.model() is interval_model:
+            return # Same list as before (e.g. 1y -> 2y): keep the combo and its selection as-is
+
+        # Block signals during the model swap so listeners don't see the transient
+        # selection; one change notification is sent afterwards.
+        # Repaints are held off too, so the combo is redrawn once with the final list.
+        combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(combo):
+                combo.setModel(interval_model)
+
+                # Restore previous selection or set default
+                if current_interval in unique_intervals:
+                    combo.setCurrentText(current_interval)
+                elif default_interval_const in unique_intervals:
+                     combo.setCurrentText(default_interval_const)
+                elif unique_intervals:
+                     combo.setCurrentIndex(0)
+        finally:
+            combo.setUpdatesEnabled(True)
+
+        if combo.currentText() != current_interval:
+            combo.currentTextChanged.emit(combo.currentText())
 
         print(f"Interval options updated for period '{selected_period}': {unique_intervals}")
 
@@ -121,7 +293,7 @@ class FinanceApp(QMainWindow):
     # --- Action Slots ---
 
     def _request_fetch_and_plot(self):
-        """Fetches data based on UI selections and triggers plotting."""
+        """Starts a background fetch based on UI selections; plotting happens in _on_fetch_complete."""
         ticker = self.ui.ticker_input.text().strip().upper()
         period = self.ui.period_combo.currentText()
         interval = self.ui.interval_combo.currentText()
@@ -133,18 +305,33 @@ class FinanceApp(QMainWindow):
 
         print(f"Request received: Ticker={ticker}, Period={period}, Interval={interval}")
         self.status_bar.showMessage(f"Fetching {ticker} ({period} / {interval})...", 0)
-        QApplication.processEvents()
+
+        # The network round-trip runs on a pool thread so the window stays responsive.
+        # Only the most recent request is plotted; results of superseded ones are dropped.
+        self._fetch_counter += 1
+        self._pending_fetch = self._fetch_counter
+        self.ui.fetch_button.setEnabled(False)
+        worker = FetchWorker(self.data_fetcher, ticker, period, interval, self._fetch_counter)
+        worker.signals.finished.connect(self._on_fetch_complete)
+        worker.signals.failed.connect(self._on_fetch_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_fetch_complete(self, fetched_data: pd.DataFrame, ticker: str, period: str, interval: str, request_id: int):
+        """Receives fetched data from FetchWorker (on the GUI thread) and plots it."""
+        if request_id != self._pending_fetch:
+            print(f"Discarding stale fetch result for {ticker} ({period}/{interval}).")
+            return
+        self._pending_fetch = None
+        self.ui.fetch_button.setEnabled(True)
 
         self.current_ticker = ticker
-        self.indicators_config = []
+        self.indicators_config = {}
         self.indicator_results = {}
+        self.current_data = fetched_data
 
         try:
-            fetched_data = self.data_fetcher.fetch_stock_data(ticker, period=period, interval=interval)
-            self.current_data = fetched_data
-
-            required_cols = ["Open", "High", "Low", "Close", "Volume"]
-            if self.current_data.empty or not all(col in self.current_data.columns for col in required_cols):
+            # DataFetcher already raised for missing OHLCV columns; it only returns empty on no data
+            if not self._data_is_valid:
                  warning_msg = f"No valid OHLCV data found for '{ticker}' ({period}/{interval})."
                  print(warning_msg)
                  self.status_bar.showMessage(warning_msg, 6000)
@@ -153,28 +340,39 @@ class FinanceApp(QMainWindow):
                  return
 
             self.status_bar.showMessage(f"Plotting {ticker}...", 0)
-            QApplication.processEvents()
             self._recalculate_and_plot_all()
             self.status_bar.showMessage(f"{ticker} ({period}/{interval}) plotted successfully.", 5000)
 
-        except ValueError as ve:
-            error_message = f"Data Fetch Error ({ticker}): {ve}"
+        except Exception as e:
+            self._report_error(e, ticker)
+
+    def _on_fetch_failed(self, error: Exception, ticker: str, period: str, interval: str, request_id: int):
+        """Reports a failed fetch, unless a newer fetch has been started or handled since."""
+        if request_id != self._pending_fetch:
+            print(f"Ignoring error from stale fetch for {ticker}: {error}")
+            return
+        self._pending_fetch = None
+        self.ui.fetch_button.setEnabled(True)
+        self._report_error(error, ticker)
+
+    def _report_error(self, error: Exception, ticker: str):
+        """Shows a fetch or plot error and clears the chart."""
+        if isinstance(error, ValueError):
+            error_message = f"Data Fetch Error ({ticker}): {error}"
             print(error_message)
             self.status_bar.showMessage(f"Error fetching {ticker}: Check inputs/network.", 8000)
-            QMessageBox.critical(self, "Data Fetch Error", f"Could not fetch data for {ticker}:\n\n{ve}")
-            self.current_data = None
-            self.chart_manager.clear_chart()
-        except Exception as e:
-            error_message = f"Unexpected error ({ticker}): {e}"
+            QMessageBox.critical(self, "Data Fetch Error", f"Could not fetch data for {ticker}:\n\n{error}")
+        else:
+            error_message = f"Unexpected error ({ticker}): {error}"
             print(error_message)
             self.status_bar.showMessage("An unexpected error occurred. Check logs.", 8000)
-            QMessageBox.critical(self, "Application Error", f"An unexpected error occurred:\n\n{e}")
-            self.current_data = None
-            self.chart_manager.clear_chart()
+            QMessageBox.critical(self, "Application Error", f"An unexpected error occurred:\n\n{error}")
+        self.current_data = None
+        self.chart_manager.clear_chart()
 
     def _handle_add_indicator_request(self):
         """Handles the 'Add Indicator' button click."""
-        if self.current_data is None or self.current_data.empty:
+        if not self._data_is_valid:
             self.status_bar.showMessage("Cannot add indicator: Fetch stock data first.", 4000)
             return
 
@@ -182,78 +380,169 @@ class FinanceApp(QMainWindow):
         period = self.ui.indicator_period_spinbox.value()
         indicator_id = f"{indicator_type.lower()}_{period}"
 
-        if any(ind['id'] == indicator_id for ind in self.indicators_config):
+        if indicator_id in self.indicators_config:
             self.status_bar.showMessage(f"{indicator_type}({period}) is already added.", 3000)
             return
 
-        plot_type = 'overlay' if indicator_type == 'SMA' else 'subplot'
+        spec = INDICATOR_SPECS.get(indicator_type)
+        if spec is None:
+            self.status_bar.showMessage(f"Unsupported indicator type: {indicator_type}.", 4000)
+            return
+        plot_type = spec['plot_type']
         config = {'id': indicator_id, 'type': indicator_type, 'params': {'period': period}, 'plot_type': plot_type}
 
         print(f"Adding indicator request: {config}")
-        self.indicators_config.append(config)
+        self.indicators_config[indicator_id] = config
         self.status_bar.showMessage(f"Added {indicator_type}({period}). Replotting...", 0)
-        QApplication.processEvents()
 
-        self._recalculate_and_plot_all()
-        self.status_bar.showMessage(f"Indicators updated for {self.current_ticker}.", 4000)
+        # Restarting the timer folds rapid repeated requests into one replot
+        self._replot_timer.start()
 
 
     def _recalculate_and_plot_all(self):
-        """Clears chart, plots base data, calculates/plots indicators."""
-        if self.current_data is None or self.current_data.empty:
+        """
+        Brings the chart in line with current_data and indicators_config.
+
+        The price/volume plots are only updated when the data itself changed (and
+        then in place via ChartManager.update_price). Indicators are diffed against
+        what is already plotted: removed ones are taken off the chart and only new
+        ones are calculated and added, so adding an indicator costs one curve.
+        When the data changed, every configured indicator is recalculated and its
+        existing curve/subplot is updated in place. Calculated values (ndarrays aligned
+        with current_data's rows) are kept in indicator_results for as long as
+        current_data is the same object, so an indicator is only recalculated when
+        its inputs changed. Missing values are calculated by an IndicatorWorker on
+        the thread pool and plotted when _on_indicators_calculated calls back here.
+        If the chart already shows exactly the current data and configured
+        indicators, it returns without touching anything.
+        """
+        if not self._data_is_valid:
             print("Plotting skipped: No current stock data available.")
             return
 
-        print("Recalculating all indicators and updating plot...")
-
-        self.chart_manager.clear_chart()
-        self.chart_manager.plot_stock_data(self.current_data, self.current_ticker)
+        if (self.chart_manager.price_plot is not None
+                and self._plotted_data is self.current_data
+                and self._results_data is self.current_data
+                and self._indicator_data.keys() == self.indicators_config.keys()
+                and all(data is self.current_data for data in self._indicator_data.values())):
+            return # Nothing changed since the last replot (e.g. a coalesced duplicate request)
+
+        print("Recalculating indicators and updating plot...")
+
+        data_changed = self.chart_manager.price_plot is None or self._plotted_data is not self.current_data
+        if data_changed:
+            self.chart_manager.update_price(self.current_data, self.current_ticker)
+            self._plotted_data = self.current_data
+        if self._results_data is not self.current_data:
+            # Cached indicator arrays were computed from other data
+            self.indicator_results.clear()
+            self._results_data = self.current_data
+            self._calc_in_flight.clear() # Results still being calculated are for the old data
+            # Indicators only read Close: extract it once per data set as a float64 array
+            self._close_np = self.current_data['Close'].to_numpy(dtype=np.float64, copy=False)
+            from chart_manager import index_to_epoch_seconds # Already loaded by __init__
+            self._x_epoch = index_to_epoch_seconds(self.current_data.index)
 
         if self.chart_manager.price_plot is None:
             print("Base data plotting failed, skipping indicators.")
             self.status_bar.showMessage("Error plotting base data.", 5000)
+            self._plotted_data = None
+            return
+
+        # Remove indicators that are plotted (or cached) but no longer configured
+        for indicator_id in [i for i in self.chart_manager.indicator_plots if i not in self.indicators_config]:
+            self.chart_manager.remove_indicator(indicator_id)
+        for indicator_id in [i for i in self.indicator_results if i not in self.indicators_config]:
+            del self.indicator_results[indicator_id]
+        for indicator_id in [i for i in self._indicator_data if i not in self.indicators_config]:
+            del self._indicator_data[indicator_id]
+
+        # Indicators whose curve is missing or was calculated from other data
+        stale_ids = [i for i in self.indicators_config if self._indicator_data.get(i) is not self.current_data]
+
+        # Anything without a result yet is calculated off the GUI thread; this method
+        # runs again (via _on_indicators_calculated) once the results are in
+        to_calculate = {
+            indicator_id: self.indicators_config[indicator_id] for indicator_id in stale_ids
+            if indicator_id not in self.indicator_results and indicator_id not in self._calc_in_flight
+        }
+        if to_calculate:
+            self._calc_in_flight.update(to_calculate)
+            # One worker per indicator type: types run in parallel on the pool (the numba
+            # kernels release the GIL), while periods of one type still share their batch
+            configs_by_type = {}
+            for indicator_id, config in to_calculate.items():
+                configs_by_type.setdefault(config['type'], {})[indicator_id] = config
+            for configs in configs_by_type.values():
+                worker = IndicatorWorker(self.indicator_calculator, self._close_np, configs, self.current_data)
+                worker.signals.finished.connect(self._on_indicators_calculated)
+                QThreadPool.globalInstance().start(worker)
+            self.status_bar.showMessage("Calculating indicators...", 0)
+
+        ready_ids = [i for i in stale_ids if i in self.indicator_results]
+        if not ready_ids:
             return
 
-        self.indicator_results.clear()
-        next_subplot_row = 2
-
-        for config in self.indicators_config:
-            indicator_id = config['id']
-            indicator_type = config['type']
-            params = config['params']
-            plot_type = config['plot_type']
-            calculated_data = None
-
-            try:
-                if indicator_type == 'SMA':
-                    calculated_data = self.indicator_calculator.calculate_sma(self.current_data, params['period'])
-                elif indicator_type == 'RSI':
-                    calculated_data = self.indicator_calculator.calculate_rsi(self.current_data, params['period'])
-
-                if calculated_data is not None and not calculated_data.empty:
-                    self.indicator_results[indicator_id] = calculated_data
-                    name = f"{indicator_type}({params['period']})"
-                    if plot_type == 'overlay':
-                        color = 'orange' if 'sma' in indicator_id else 'purple'
-                        self.chart_manager.add_overlay_indicator(indicator_id, calculated_data, name, color, width=2)
-                    elif plot_type == 'subplot':
-                        self.chart_manager.add_subplot_indicator(indicator_id, calculated_data, name, indicator_type, next_subplot_row, color='cyan')
-                        next_subplot_row += 1
-                else:
-                     print(f"Indicator {indicator_id} calculation returned no data.")
-
-            except Exception as e:
-                error_msg = f"Error processing indicator {indicator_id}: {e}"
-                print(error_msg)
-                self.status_bar.showMessage(f"Error with indicator {indicator_id}.", 5000)
+        # Batch all indicator changes into a single repaint of the chart widget
+        graphics_widget = self.ui.graphics_widget
+        had_errors = False
+        graphics_widget.setUpdatesEnabled(False)
+        self.ui.begin_bulk_update() # ...and a single range update per plot
+        try:
+            for indicator_id in ready_ids:
+                config = self.indicators_config[indicator_id]
+                indicator_type = config['type']
+                params = config['params']
+                plot_type = config['plot_type']
+                calculated_data = self.indicator_results[indicator_id]
+                self._indicator_data[indicator_id] = self.current_data
+
+                try:
+                    if calculated_data.size:
+                        name = f"{indicator_type}({params['period']})"
+                        pen = self.INDICATOR_PENS.get(indicator_type.lower(), self.INDICATOR_PENS['default'])
+                        if plot_type == 'overlay':
+                            self.chart_manager.add_overlay_indicator(indicator_id, calculated_data, name, pen=pen, x=self._x_epoch)
+                        elif plot_type == 'subplot':
+                            row_index = self.chart_manager.next_subplot_row()
+                            self.chart_manager.add_subplot_indicator(indicator_id, calculated_data, name, indicator_type, row_index, pen=pen, x=self._x_epoch)
+                    else:
+                         print(f"Indicator {indicator_id} calculation returned no data.")
+                         self.chart_manager.remove_indicator(indicator_id)
+
+                except Exception as e:
+                    error_msg = f"Error processing indicator {indicator_id}: {e}"
+                    print(error_msg)
+                    self.chart_manager.remove_indicator(indicator_id) # Don't keep a curve for the old data
+                    self.status_bar.showMessage(f"Error with indicator {indicator_id}.", 5000)
+                    had_errors = True
+        finally:
+            self.ui.end_bulk_update()
+            graphics_widget.setUpdatesEnabled(True)
+            graphics_widget.viewport().update()
 
         print("Recalculation and plotting complete.")
+        if not had_errors and not self._calc_in_flight:
+            self.status_bar.showMessage(f"Indicators updated for {self.current_ticker}.", 4000)
+
+    def _on_indicators_calculated(self, results: dict, source_data: pd.DataFrame):
+        """Receives IndicatorWorker results (on the GUI thread) and plots them."""
+        if source_data is not self._results_data:
+            print("Discarding indicator results calculated from outdated data.")
+            return
+        for indicator_id, values in results.items():
+            self._calc_in_flight.discard(indicator_id)
+            if indicator_id in self.indicators_config:
+                self.indicator_results[indicator_id] = values
+        self._recalculate_and_plot_all()
 
 
 # ---- Application Entry Point ----
 def main():
     """Initializes and runs the Qt application."""
     print("Starting Ava's Pro Finance App...")
+    # INFO by default; set level=logging.DEBUG to see the per-plot/per-fetch trace messages
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
     try:
         if hasattr(Qt, 'AA_EnableHighDpiScaling'): QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         if hasattr(Qt, 'AA_UseHighDpiPixmaps'): QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -261,8 +550,27 @@ def main():
 
     app = QApplication(sys.argv)
     apply_dark_theme(app) # Apply theme using function from ui_manager
+    # Heavy imports only once the QApplication exists
+    import pyqtgraph as pg
+    from numba_compat import NUMBA_AVAILABLE
     pg.setConfigOption('background', QColor(40, 40, 40))
     pg.setConfigOption('foreground', 'w')
+    pg.setConfigOptions(antialias=False) # Antialiasing is the main per-pixel cost of long curves
+    if NUMBA_AVAILABLE:
+        # Let pyqtgraph build curve paths with its numba kernels (only if numba is installed)
+        try:
+            pg.setConfigOptions(useNumba=True)
+        except KeyError:
+            print("This pyqtgraph version has no 'useNumba' option; using its NumPy path.")
+    # Opt-in GPU rendering: must be configured before the GraphicsLayoutWidget is created.
+    # Not the default because it needs PyOpenGL and a working GL driver.
+    if os.environ.get("TOKTIK_USE_OPENGL") == "1":
+        try:
+            import OpenGL # noqa: F401 (only checking that PyOpenGL is installed)
+            pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+            print("OpenGL rendering enabled (TOKTIK_USE_OPENGL=1).")
+        except ImportError:
+            print("TOKTIK_USE_OPENGL=1 but PyOpenGL is not installed; using the raster backend.")
 
     window = FinanceApp()
     window.showMaximized()
@@ -277,5 +585,6 @@ if __name__ == "__main__":
     print("Requires: PySide6, yfinance, pyqtgraph, pandas, numpy, pytz")
     print("Files: finance_app.py, ui_manager.py, data_fetcher.py, chart_manager.py, indicator_calculator.py") # Added ui_manager.py
     print("Ensure virtual environment is active and all files are in the same directory.")
+    print("Optional: set TOKTIK_USE_OPENGL=1 (requires PyOpenGL) for OpenGL rendering; raster is used otherwise.")
     print("-" * 60)
     main()
\ No newline at end of file
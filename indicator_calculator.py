@@ -2,10 +2,151 @@
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import logging # Optional
 
+from numba_compat import njit, NUMBA_AVAILABLE
+
 # logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+# --- Compiled Indicator Kernels ---
+# The kernels take a contiguous float64 close array (finite values; DataFetcher drops
+# NaN/inf rows), or gains/losses derived from it, and return a float64 array as long as
+# the close array with NaN warm-up values. Without Numba the public methods use the
+# NumPy fallbacks (_sma_cumsum, _rsi_numpy, _rsi_changes_numpy).
+# nogil=True lets kernels called from different worker threads run in parallel.
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _sma_loop(close, n):
+    """Simple moving average over a running window sum."""
+    size = close.shape[0]
+    out = np.empty(size, dtype=np.float64)
+    window_sum = 0.0
+    for i in range(size):
+        window_sum += close[i]
+        if i >= n:
+            window_sum -= close[i - n]
+        if i >= n - 1:
+            out[i] = window_sum / n
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _rsi_loop(close, n):
+    """Wilder's RSI: SMA-seeded average gain/loss, then (prev * (n - 1) + current) / n smoothing."""
+    size = close.shape[0]
+    out = np.empty(size, dtype=np.float64)
+    out[:] = np.nan
+    if size <= n:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= n
+    avg_loss /= n
+
+    for i in range(n, size):
+        if i > n:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+        if avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0.0 else 50.0 # No losses: max RSI (flat prices: neutral)
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _rsi_changes_loop(gains, losses, n):
+    """_rsi_loop over precomputed bar-to-bar gains/losses (len(close) - 1 each), so several periods can share them."""
+    size = gains.shape[0] + 1
+    out = np.empty(size, dtype=np.float64)
+    out[:] = np.nan
+    if size <= n:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= n
+    avg_loss /= n
+
+    for i in range(n, size):
+        if i > n:
+            avg_gain = (avg_gain * (n - 1) + gains[i - 1]) / n
+            avg_loss = (avg_loss * (n - 1) + losses[i - 1]) / n
+        if avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0.0 else 50.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+def _price_changes(close: np.ndarray) -> tuple:
+    """Splits bar-to-bar close changes into (gains, losses), both >= 0 and len(close) - 1 long."""
+    delta = np.diff(close)
+    return np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0)
+
+
+def _sma_cumsum(close: np.ndarray, n: int) -> np.ndarray:
+    """NumPy fallback for _sma_loop: window sums as differences of one cumulative sum (O(n))."""
+    out = np.full(close.shape[0], np.nan)
+    csum = np.cumsum(close)
+    out[n - 1:] = (csum[n - 1:] - np.concatenate(([0.0], csum[:-n]))) / n
+    return out
+
+
+def _sliding_window(close: np.ndarray, n: int) -> np.ndarray:
+    """
+    Returns a read-only (len - n + 1, n) view of every n-bar window (no copy).
+
+    Meant for window reducers that can't be split into running sums (std, max,
+    weighted dot products); row i is the window ending at bar i + n - 1.
+    """
+    return sliding_window_view(close, n)
+
+
+def _rsi_numpy(close: np.ndarray, n: int) -> np.ndarray:
+    """NumPy/pandas fallback for _rsi_loop (same result, no Numba)."""
+    return _rsi_changes_numpy(*_price_changes(close), n)
+
+
+def _rsi_changes_numpy(gains: np.ndarray, losses: np.ndarray, n: int) -> np.ndarray:
+    """NumPy/pandas fallback for _rsi_changes_loop."""
+    out = np.full(gains.shape[0] + 1, np.nan)
+    if out.shape[0] <= n:
+        return out
+    # Wilder smoothing == EWM with alpha=1/n (adjust=False), seeded with the first n-bar mean
+    alpha = 1.0 / n
+    avg_gain = pd.Series(np.concatenate(([gains[:n].mean()], gains[n:]))).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(np.concatenate(([losses[:n].mean()], losses[n:]))).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    rsi = np.where(avg_loss == 0.0, np.where(avg_gain > 0.0, 100.0, 50.0), rsi)
+    out[n:] = rsi
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) now, not on the first user click
+    _sma_loop(np.zeros(2), 1)
+    _rsi_loop(np.zeros(2), 1)
+    _rsi_changes_loop(np.zeros(1), np.zeros(1), 1)
+
 class IndicatorCalculator:
     """
     Provides static methods to calculate various technical indicators based on stock data.
@@ -13,7 +154,11 @@ class IndicatorCalculator:
     Each calculation method takes a pandas DataFrame (expected to have OHLC columns
     and a DatetimeIndex) and indicator-specific parameters, returning a pandas Series
     with the calculated indicator values, aligned to the original DataFrame's index.
+
+    The *_array variants take the float64 Close array directly and return a plain
+    ndarray of the same length, for callers that don't need pandas objects.
     """
+    __slots__ = () # Stateless: no per-instance __dict__
 
     def __init__(self):
         """
@@ -23,6 +168,144 @@ class IndicatorCalculator:
         print("IndicatorCalculator initialized.")
         # logging.info("IndicatorCalculator initialized.")
 
+    @staticmethod
+    def _validate(data: pd.DataFrame, period: int, label: str, extra_bars: int = 0) -> np.ndarray | None:
+        """
+        Runs the input checks shared by the DataFrame-based calculators.
+
+        Args:
+            data (pd.DataFrame): DataFrame expected to have a 'Close' column.
+            period (int): The lookback period; must be a positive integer.
+            label (str): Indicator name used in warning messages (e.g. 'SMA').
+            extra_bars (int): Rows needed beyond 'period' (e.g. 1 for indicators on price changes).
+
+        Returns:
+            np.ndarray or None: The contiguous float64 Close array, or None if any check failed
+                                (a warning has been printed).
+        """
+        if not isinstance(data, pd.DataFrame) or data.empty:
+            print(f"Warning ({label}): Input 'data' must be a non-empty DataFrame.")
+            return None
+        if 'Close' not in data.columns:
+            print(f"Warning ({label}): DataFrame must contain a 'Close' column.")
+            return None
+        if not isinstance(period, int) or period <= 0:
+            print(f"Warning ({label}): Period must be a positive integer (got {period}).")
+            return None
+        if len(data) < period + extra_bars:
+            print(f"Warning ({label}): Period ({period}) is too large for data length ({len(data)}). Returning empty Series.")
+            return None
+        return np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64, copy=False))
+
+    @staticmethod
+    def calculate_sma_array(close: np.ndarray, period: int) -> np.ndarray:
+        """
+        Calculates the Simple Moving Average (SMA) of a close price array.
+
+        Args:
+            close (np.ndarray): Close prices (float64, no NaNs).
+            period (int): The lookback period (number of bars). Must be > 0.
+
+        Returns:
+            np.ndarray: SMA values, same length as 'close' with NaN for the first
+                        'period-1' points. Empty if the input or period is invalid.
+        """
+        if not isinstance(period, int) or period <= 0 or period > len(close):
+            print(f"Warning (SMA): Invalid period {period} for {len(close)} bars.")
+            return np.empty(0, dtype=np.float64)
+        print(f"Calculating SMA with period {period}...")
+        try:
+            close = np.ascontiguousarray(close, dtype=np.float64)
+            return _sma_loop(close, period) if NUMBA_AVAILABLE else _sma_cumsum(close, period)
+        except Exception as e:
+            print(f"Error calculating SMA(period={period}): {e}")
+            return np.empty(0, dtype=np.float64)
+
+    @staticmethod
+    def calculate_smas_array(close: np.ndarray, periods) -> dict:
+        """
+        Calculates several SMAs of the same close array from one cumulative sum.
+
+        Each period is then just two slices of that sum, so the close array is
+        read once no matter how many periods are requested.
+
+        Args:
+            close (np.ndarray): Close prices (float64, no NaNs).
+            periods (iterable of int): The lookback periods. Invalid ones are skipped.
+
+        Returns:
+            dict: {period: np.ndarray} SMA values, each the same length as 'close' with
+                  NaN for the first 'period-1' points (empty dict on error).
+        """
+        valid_periods = [p for p in periods if isinstance(p, int) and 0 < p <= len(close)]
+        print(f"Calculating SMAs with periods {valid_periods}...")
+        try:
+            close = np.ascontiguousarray(close, dtype=np.float64)
+            csum = np.concatenate(([0.0], np.cumsum(close))) # csum[i] = sum(close[:i])
+            results = {}
+            for period in valid_periods:
+                out = np.full(close.shape[0], np.nan)
+                out[period - 1:] = (csum[period:] - csum[:-period]) / period
+                results[period] = out
+            return results
+        except Exception as e:
+            print(f"Error calculating SMAs(periods={valid_periods}): {e}")
+            return {}
+
+    @staticmethod
+    def extend_sma(prev_sma: np.ndarray, close: np.ndarray, period: int, new_start_idx: int) -> np.ndarray:
+        """
+        Extends an SMA to bars appended after it was calculated.
+
+        Values before new_start_idx are copied from prev_sma; each later bar applies
+        V[t] = V[t-1] + (close[t] - close[t-period]) / period (as one cumulative sum),
+        so the cost is proportional to the number of new bars only.
+
+        Args:
+            prev_sma (np.ndarray): SMA of a series whose first new_start_idx closes equal close's.
+            close (np.ndarray): Close prices of the new (extended) series.
+            period (int): The SMA period prev_sma was calculated with.
+            new_start_idx (int): Index of the first bar not covered by prev_sma.
+
+        Returns:
+            np.ndarray: SMA values for all of 'close' (recalculated in full if prev_sma
+                        has no valid value to continue from).
+        """
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        if new_start_idx < period or new_start_idx > len(prev_sma):
+            return IndicatorCalculator.calculate_sma_array(close, period)
+        out = np.empty(close.shape[0], dtype=np.float64)
+        start = min(new_start_idx, close.shape[0])
+        out[:start] = prev_sma[:start]
+        if start < close.shape[0]:
+            steps = (close[start:] - close[start - period:close.shape[0] - period]) / period
+            out[start:] = out[start - 1] + np.cumsum(steps)
+        return out
+
+    @staticmethod
+    def calculate_rsi_array(close: np.ndarray, period: int = 14) -> np.ndarray:
+        """
+        Calculates Wilder's Relative Strength Index (RSI) of a close price array.
+
+        Args:
+            close (np.ndarray): Close prices (float64, no NaNs).
+            period (int): The lookback period (default 14). Must be > 0.
+
+        Returns:
+            np.ndarray: RSI values (0-100), same length as 'close' with NaN for the
+                        first 'period' points. Empty if the input or period is invalid.
+        """
+        if not isinstance(period, int) or period <= 0 or period >= len(close):
+            print(f"Warning (RSI): Invalid period {period} for {len(close)} bars.")
+            return np.empty(0, dtype=np.float64)
+        print(f"Calculating RSI with period {period}...")
+        try:
+            close = np.ascontiguousarray(close, dtype=np.float64)
+            return _rsi_loop(close, period) if NUMBA_AVAILABLE else _rsi_numpy(close, period)
+        except Exception as e:
+            print(f"Error calculating RSI(period={period}): {e}")
+            return np.empty(0, dtype=np.float64)
+
     @staticmethod
     def calculate_sma(data: pd.DataFrame, period: int) -> pd.Series:
         """
@@ -40,37 +323,20 @@ class IndicatorCalculator:
                        at the beginning of the series (for the first 'period-1' points).
         """
         # --- Input Validation ---
-        if not isinstance(data, pd.DataFrame) or data.empty:
-            print("Warning (SMA): Input 'data' must be a non-empty DataFrame.")
-            # logging.warning("SMA calculation skipped: Invalid data input.")
+        close = IndicatorCalculator._validate(data, period, 'SMA')
+        if close is None:
             return pd.Series(dtype=np.float64) # Return empty series for consistency
 
-        if 'Close' not in data.columns:
-            print("Warning (SMA): DataFrame must contain a 'Close' column.")
-            # logging.warning("SMA calculation skipped: 'Close' column missing.")
-            return pd.Series(dtype=np.float64)
-
-        if not isinstance(period, int) or period <= 0:
-            print(f"Warning (SMA): Period must be a positive integer (got {period}).")
-            # logging.warning(f"SMA calculation skipped: Invalid period {period}.")
-            return pd.Series(dtype=np.float64)
-
-        if period > len(data):
-            # Period is longer than the entire dataset
-            print(f"Warning (SMA): Period ({period}) is larger than data length ({len(data)}). Returning empty Series.")
-            # logging.warning(f"SMA calculation skipped: Period {period} > data length {len(data)}.")
-            return pd.Series(dtype=np.float64)
-
         # --- Calculation ---
         print(f"Calculating SMA with period {period}...")
         # logging.info(f"Calculating SMA(period={period})")
         try:
-            # Use pandas rolling mean for efficient calculation
-            sma_series = data['Close'].rolling(window=period).mean()
-            sma_series.name = f"SMA_{period}" # Assign a descriptive name
-            return sma_series
+            # Compiled loop (or cumulative-sum fallback) straight over the float64 close
+            # buffer, with no pandas rolling-window machinery
+            sma_values = _sma_loop(close, period) if NUMBA_AVAILABLE else _sma_cumsum(close, period)
+            return pd.Series(sma_values, index=data.index, name=f"SMA_{period}")
         except Exception as e:
-            # Catch potential errors during the rolling calculation
+            # Catch potential errors during the calculation
             print(f"Error calculating SMA(period={period}): {e}")
             # logging.error(f"Error calculating SMA(period={period}): {e}", exc_info=True)
             return pd.Series(dtype=np.float64) # Return empty series on error
@@ -78,71 +344,92 @@ class IndicatorCalculator:
     @staticmethod
     def calculate_rsi(data: pd.DataFrame, period: int = 14) -> pd.Series:
         """
-        Calculates the Relative Strength Index (RSI).
+        Calculates the Relative Strength Index (RSI) using Wilder's smoothing.
 
-        *** NOTE: THIS IS CURRENTLY A PLACEHOLDER IMPLEMENTATION ***
-        It returns random dummy data for demonstration purposes within the framework.
-        A proper implementation requires calculating average gains and losses.
+        The first average gain/loss is the simple mean over the first 'period'
+        price changes; after that each average is (previous * (period - 1) + current) / period.
 
         Args:
             data (pd.DataFrame): DataFrame containing stock data (needs 'Close' column).
             period (int): The lookback period for RSI (default 14). Must be > 0.
 
         Returns:
-            pd.Series: Series containing the RSI values (typically 0-100).
-                       Index matches the input data. Contains dummy data in this version.
-                       Returns an empty Series on invalid input.
+            pd.Series: Series containing the RSI values (0-100). Index matches the input data;
+                       the first 'period' values are NaN. Returns an empty Series on invalid input.
         """
         # --- Input Validation ---
-        if not isinstance(data, pd.DataFrame) or data.empty:
-            print("Warning (RSI): Input 'data' must be a non-empty DataFrame.")
-            # logging.warning("RSI calculation skipped: Invalid data input.")
+        # RSI needs 'period' price changes before its first value, i.e. period + 1 bars
+        close = IndicatorCalculator._validate(data, period, 'RSI', extra_bars=1)
+        if close is None:
             return pd.Series(dtype=np.float64)
 
-        if 'Close' not in data.columns:
-            print("Warning (RSI): DataFrame must contain a 'Close' column.")
-            # logging.warning("RSI calculation skipped: 'Close' column missing.")
-            return pd.Series(dtype=np.float64)
+        print(f"Calculating RSI with period {period}...")
+        # logging.info(f"Calculating RSI(period={period})")
 
-        if not isinstance(period, int) or period <= 0:
-            print(f"Warning (RSI): Period must be a positive integer (got {period}).")
-            # logging.warning(f"RSI calculation skipped: Invalid period {period}.")
+        try:
+            rsi_values = _rsi_loop(close, period) if NUMBA_AVAILABLE else _rsi_numpy(close, period)
+            return pd.Series(rsi_values, index=data.index, name=f"RSI_{period}")
+        except Exception as e:
+            print(f"Error calculating RSI(period={period}): {e}")
+            # logging.error(f"Error calculating RSI(period={period}): {e}", exc_info=True)
             return pd.Series(dtype=np.float64)
 
-        if period >= len(data): # RSI needs at least 'period' bars + 1 for calculation usually
-             print(f"Warning (RSI): Period ({period}) is too large for data length ({len(data)}). Returning empty Series.")
-             # logging.warning(f"RSI calculation skipped: Period {period} >= data length {len(data)}.")
-             return pd.Series(dtype=np.float64)
-
-        print(f"Calculating RSI with period {period} (using DUMMY data)...")
-        # logging.info(f"Calculating RSI(period={period}) - DUMMY DATA")
-
-        # --- Proper RSI Calculation Logic (to be implemented later) ---
-        # 1. Calculate price changes: delta = data['Close'].diff(1)
-        # 2. Separate gains (up) and losses (down): gain = delta.where(delta > 0, 0.0); loss = -delta.where(delta < 0, 0.0)
-        # 3. Calculate initial average gain/loss (SMA): avg_gain = gain.rolling(window=period).mean(); avg_loss = loss.rolling(window=period).mean()
-        # 4. Calculate subsequent average gain/loss (smoothed, e.g., Wilder's):
-        #    For i >= period: avg_gain[i] = (avg_gain[i-1] * (period - 1) + gain[i]) / period
-        #    For i >= period: avg_loss[i] = (avg_loss[i-1] * (period - 1) + loss[i]) / period
-        # 5. Calculate RS: rs = avg_gain / avg_loss (handle division by zero, replace inf with large number or NaN)
-        # 6. Calculate RSI: rsi = 100.0 - (100.0 / (1.0 + rs))
-        # rsi_series = ... (result of above calculation)
-        # rsi_series.name = f"RSI_{period}"
-        # return rsi_series
-        # ---------------------------------------------------------------
-
-        # --- Dummy Data Implementation ---
-        # Generate random numbers between 0 and 100
+    @staticmethod
+    def calculate_rsis_array(close: np.ndarray, periods) -> dict:
+        """
+        Calculates Wilder's RSI of the same close array for several periods.
+
+        The bar-to-bar gains and losses don't depend on the period, so they are
+        computed once and every period only runs the smoothing pass over them.
+
+        Args:
+            close (np.ndarray): Close prices (float64, no NaNs).
+            periods (iterable of int): The lookback periods. Invalid ones are skipped.
+
+        Returns:
+            dict: {period: np.ndarray} RSI values (0-100), each the same length as 'close'
+                  with NaN for the first 'period' points (empty dict on error).
+        """
+        valid_periods = [p for p in periods if isinstance(p, int) and 0 < p < len(close)]
+        print(f"Calculating RSIs with periods {valid_periods}...")
         try:
-            rsi_dummy = pd.Series(np.random.rand(len(data)) * 100, index=data.index)
-            # Introduce NaNs at the beginning, similar to how real indicators behave
-            rsi_dummy.iloc[:period] = np.nan # Typically need 'period' values to calculate first RSI
-            rsi_dummy.name = f"RSI_{period}_dummy"
-            return rsi_dummy
+            gains, losses = _price_changes(np.ascontiguousarray(close, dtype=np.float64))
+            rsi_kernel = _rsi_changes_loop if NUMBA_AVAILABLE else _rsi_changes_numpy
+            return {period: rsi_kernel(gains, losses, period) for period in valid_periods}
         except Exception as e:
-            print(f"Error generating dummy RSI data (period={period}): {e}")
-            # logging.error(f"Error generating dummy RSI(period={period}): {e}", exc_info=True)
-            return pd.Series(dtype=np.float64)
+            print(f"Error calculating RSIs(periods={valid_periods}): {e}")
+            return {}
+
+    @staticmethod
+    def calculate_bollinger_bands_array(close: np.ndarray, period: int = 20, num_std: float = 2.0) -> tuple:
+        """
+        Calculates Bollinger Bands (SMA +/- num_std population standard deviations).
+
+        Mean and standard deviation are reduced directly over a sliding-window view
+        of the close array, with no pandas rolling objects.
+
+        Args:
+            close (np.ndarray): Close prices (float64, no NaNs).
+            period (int): The lookback period (default 20). Must be > 0.
+            num_std (float): Band width in standard deviations (default 2.0).
+
+        Returns:
+            tuple: (middle, upper, lower) ndarrays, same length as 'close' with NaN for
+                   the first 'period-1' points. Empty arrays if the input or period is invalid.
+        """
+        if not isinstance(period, int) or period <= 0 or period > len(close):
+            print(f"Warning (BBANDS): Invalid period {period} for {len(close)} bars.")
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty
+        print(f"Calculating Bollinger Bands with period {period}...")
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        windows = _sliding_window(close, period)
+        middle = np.full(close.shape[0], np.nan)
+        deviation = np.full(close.shape[0], np.nan)
+        middle[period - 1:] = windows.mean(axis=1)
+        deviation[period - 1:] = windows.std(axis=1, ddof=0)
+        deviation *= num_std
+        return middle, middle + deviation, middle - deviation
 
     # --- Future Indicator Methods ---
     # @staticmethod
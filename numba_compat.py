@@ -0,0 +1,22 @@
+# numba_compat.py
+
+"""
+Optional Numba support for the Finance App.
+
+Numba is not a hard requirement. Modules import `njit` and `NUMBA_AVAILABLE`
+from here; when Numba is missing, `njit` is a no-op decorator and callers are
+expected to take their NumPy code path instead of running the kernel as plain
+Python loops.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit: returns the decorated function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0] # Used as a bare @njit
+        return lambda func: func # Used as @njit(...) with a signature/options
@@ -13,101 +13,172 @@ from PySide6.QtWidgets import (
     QToolBar, QDockWidget,
     QSizePolicy # <<< Added import here
 )
-from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt, QSize
-import pyqtgraph as pg
+from PySide6.QtGui import QPalette, QColor, QBrush
+from PySide6.QtCore import Qt, QSize, QStringListModel
+from types import MappingProxyType
+import logging
+
+logger = logging.getLogger(__name__)
 
 # --- UI Related Constants ---
-FETCH_PERIODS = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+FETCH_PERIODS = ("1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
 DEFAULT_PERIOD = "1y"
-VALID_INTERVALS = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+VALID_INTERVALS = ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo")
 DEFAULT_INTERVAL = "1d"
-INTERVALS_FOR_PERIOD = {
-    "intraday_short": ["1m", "2m", "5m", "15m", "30m"],
-    "intraday_medium": ["60m", "90m", "1h"],
-    "daily_weekly": ["1d", "5d", "1wk"],
-    "monthly": ["1mo", "3mo"]
-}
+# Interval groups (read-only; the constants above are tuples for the same reason)
+INTERVALS_FOR_PERIOD = MappingProxyType({
+    "intraday_short": ("1m", "2m", "5m", "15m", "30m"),
+    "intraday_medium": ("60m", "90m", "1h"),
+    "daily_weekly": ("1d", "5d", "1wk"),
+    "monthly": ("1mo", "3mo")
+})
+# Position of each interval in VALID_INTERVALS, for sorting
+_INTERVAL_ORDER = MappingProxyType({v: i for i, v in enumerate(VALID_INTERVALS)})
+# Fetch periods grouped by length, for choosing their interval groups
+_LONG_PERIODS = frozenset({"1y", "2y", "5y", "10y", "max"})
+_MID_PERIODS = frozenset({"6mo", "ytd"})
+_SHORT_PERIODS = frozenset({"1mo", "3mo"})
+
+
+def _resolve_intervals(period: str) -> list:
+    """Returns the interval groups yfinance supports for a fetch period (unsorted)."""
+    if period in _LONG_PERIODS:
+        groups = ["daily_weekly", "monthly"]
+    elif period in _MID_PERIODS:
+        groups = ["intraday_medium", "daily_weekly", "monthly"]
+    elif period in _SHORT_PERIODS:
+        groups = ["intraday_short", "intraday_medium", "daily_weekly"]
+    else: # 1d, 5d
+        groups = ["intraday_short", "intraday_medium"]
+    return [interval for group in groups for interval in INTERVALS_FOR_PERIOD[group]]
+
+
+def _sorted_intervals(intervals) -> tuple:
+    """De-duplicates intervals and sorts them in VALID_INTERVALS order (minutes, hours, days, ...)."""
+    return tuple(sorted(set(intervals), key=lambda x: _INTERVAL_ORDER.get(x, len(_INTERVAL_ORDER))))
+
+
+# Allowed intervals per fetch period, resolved and sorted once (read-only)
+PERIOD_TO_INTERVALS = MappingProxyType({p: _sorted_intervals(_resolve_intervals(p)) for p in FETCH_PERIODS})
 
 # --- Styling Function ---
-def apply_dark_theme(app):
-    """Applies a dark color theme and stylesheet to the QApplication."""
-    # (Styling code remains the same)
+# Colors used by more than one palette role
+_DARK_BUTTON_COLOR = QColor(53, 53, 53)
+_DARK_ACCENT_COLOR = QColor(42, 130, 218)
+_DARK_DISABLED_TEXT_COLOR = QColor(127, 127, 127)
+# Palette colors as (role, color) pairs for the active/inactive groups, and for the Disabled group
+_DARK_PALETTE_SPEC = (
+    (QPalette.ColorRole.Window, QColor(45, 45, 45)),
+    (QPalette.ColorRole.WindowText, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.Base, QColor(30, 30, 30)),
+    (QPalette.ColorRole.AlternateBase, _DARK_BUTTON_COLOR),
+    (QPalette.ColorRole.ToolTipBase, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.ToolTipText, QColor(Qt.GlobalColor.black)),
+    (QPalette.ColorRole.Text, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.Button, _DARK_BUTTON_COLOR),
+    (QPalette.ColorRole.ButtonText, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.BrightText, QColor(Qt.GlobalColor.red)),
+    (QPalette.ColorRole.Link, _DARK_ACCENT_COLOR),
+    (QPalette.ColorRole.Highlight, _DARK_ACCENT_COLOR),
+    (QPalette.ColorRole.HighlightedText, QColor(Qt.GlobalColor.black)),
+)
+_DARK_DISABLED_SPEC = (
+    (QPalette.ColorRole.Text, _DARK_DISABLED_TEXT_COLOR),
+    (QPalette.ColorRole.ButtonText, _DARK_DISABLED_TEXT_COLOR),
+    (QPalette.ColorRole.Base, QColor(40, 40, 40)),
+    (QPalette.ColorRole.WindowText, _DARK_DISABLED_TEXT_COLOR),
+)
+
+
+def _build_dark_palette() -> QPalette:
+    """Builds the dark QPalette. QPalette is a plain value type, so no QApplication is needed yet."""
     dark_palette = QPalette()
-    dark_palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
-    dark_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.black)
-    dark_palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-    dark_palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-    dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(127, 127, 127))
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(127, 127, 127))
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base, QColor(40, 40, 40))
-    dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, QColor(127, 127, 127))
-    app.setPalette(dark_palette)
-    style_sheet = """
-        QMainWindow { background-color: #2d2d2d; }
-        QStatusBar { color: lightgray; padding: 3px; }
-        QStatusBar QLabel { color: lightgray; }
-        QGroupBox {
-            border: 1px solid gray; border-radius: 5px; margin-top: 0.5em;
-            font-weight: bold; color: #cccccc; padding: 5px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin; subcontrol-position: top center;
-            padding: 0 5px; background-color: #404040; border-radius: 3px;
-        }
-        QDockWidget { titlebar-close-icon: url(none); titlebar-normal-icon: url(none); }
-        QDockWidget::title {
-            text-align: center; background: #404040; padding: 4px;
-            border-radius: 3px; color: #cccccc; font-weight: bold;
-        }
-        QToolBar { background-color: #353535; border: none; padding: 2px; spacing: 5px; }
-        QToolBar QLabel { color: #cccccc; padding: 2px 5px; }
-        QToolBar QLineEdit, QToolBar QComboBox {
-             padding: 3px; border: 1px solid #505050; border-radius: 3px;
-             background-color: #3c3c3c; color: white; min-height: 20px;
-             min-width: 80px;
-        }
-        QToolBar QLineEdit { min-width: 100px; }
-        QToolBar QPushButton {
-            padding: 4px 10px; border: 1px solid #555; border-radius: 4px;
-            background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #606060, stop: 1 #454545);
-            color: white; min-height: 20px;
-        }
-        QToolBar QPushButton:hover { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #707070, stop:1 #555555); }
-        QToolBar QPushButton:pressed { background-color: #353535; }
-        QToolBar QPushButton:disabled { background-color: #404040; color: #808080; }
-        QLabel { color: #cccccc; padding: 2px; }
-        QLineEdit, QComboBox, QSpinBox {
-            padding: 5px; border: 1px solid #505050; border-radius: 3px;
-            background-color: #3c3c3c; color: white; min-height: 20px;
-        }
-        QComboBox::drop-down { border: none; }
-        QComboBox QAbstractItemView { background-color: #3c3c3c; color: white; selection-background-color: #2a82da; }
-        QPushButton {
-            padding: 6px 15px; border: 1px solid #555; border-radius: 4px;
-            background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #606060, stop: 1 #404040);
-            color: white; min-height: 20px;
-        }
-        QPushButton:hover { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #707070, stop:1 #505050); }
-        QPushButton:pressed { background-color: #353535; }
-        QPushButton:disabled { background-color: #404040; color: #808080; }
-        QToolTip { color: black; background-color: lightyellow; border: 1px solid black; }
-    """
-    app.setStyleSheet(style_sheet)
+    # setColor() wraps every color in a new QBrush; handing over one QBrush per distinct
+    # color instead lets roles with the same color share it (QBrush is implicitly shared)
+    brushes = {}
+    for role, color in _DARK_PALETTE_SPEC:
+        dark_palette.setBrush(role, brushes.setdefault(color.rgba(), QBrush(color)))
+    for role, color in _DARK_DISABLED_SPEC:
+        dark_palette.setBrush(QPalette.ColorGroup.Disabled, role, brushes.setdefault(color.rgba(), QBrush(color)))
+    return dark_palette
+
+
+# Built once at import; apply_dark_theme() only hands them to the application
+_DARK_PALETTE = _build_dark_palette()
+_DARK_STYLESHEET = """
+    QMainWindow { background-color: #2d2d2d; }
+    QStatusBar { color: lightgray; padding: 3px; }
+    QStatusBar QLabel { color: lightgray; }
+    QGroupBox {
+        border: 1px solid gray; border-radius: 5px; margin-top: 0.5em;
+        font-weight: bold; color: #cccccc; padding: 5px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin; subcontrol-position: top center;
+        padding: 0 5px; background-color: #404040; border-radius: 3px;
+    }
+    QDockWidget { titlebar-close-icon: url(none); titlebar-normal-icon: url(none); }
+    QDockWidget::title {
+        text-align: center; background: #404040; padding: 4px;
+        border-radius: 3px; color: #cccccc; font-weight: bold;
+    }
+    QToolBar { background-color: #353535; border: none; padding: 2px; spacing: 5px; }
+    QLabel#toolbarFieldLabel { color: #cccccc; padding: 2px 5px; }
+    QToolBar QLineEdit, QToolBar QComboBox {
+         padding: 3px; border: 1px solid #505050; border-radius: 3px;
+         background-color: #3c3c3c; color: white; min-height: 20px;
+         min-width: 80px;
+    }
+    QToolBar QLineEdit { min-width: 100px; }
+    QToolBar QPushButton {
+        padding: 4px 10px; border: 1px solid #555; border-radius: 4px;
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #606060, stop: 1 #454545);
+        color: white; min-height: 20px;
+    }
+    QToolBar QPushButton:hover { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #707070, stop:1 #555555); }
+    QToolBar QPushButton:pressed { background-color: #353535; }
+    QToolBar QPushButton:disabled { background-color: #404040; color: #808080; }
+    QLabel { color: #cccccc; padding: 2px; }
+    QLineEdit, QComboBox, QSpinBox {
+        padding: 5px; border: 1px solid #505050; border-radius: 3px;
+        background-color: #3c3c3c; color: white; min-height: 20px;
+    }
+    QComboBox::drop-down { border: none; }
+    QComboBox QAbstractItemView { background-color: #3c3c3c; color: white; selection-background-color: #2a82da; }
+    QPushButton {
+        padding: 6px 15px; border: 1px solid #555; border-radius: 4px;
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #606060, stop: 1 #404040);
+        color: white; min-height: 20px;
+    }
+    QPushButton:hover { background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #707070, stop:1 #505050); }
+    QPushButton:pressed { background-color: #353535; }
+    QPushButton:disabled { background-color: #404040; color: #808080; }
+    QToolTip { color: black; background-color: lightyellow; border: 1px solid black; }
+"""
+
+
+def apply_dark_theme(app):
+    """Applies the dark color theme and stylesheet to the QApplication."""
+    app.setPalette(_DARK_PALETTE)
+    app.setStyleSheet(_DARK_STYLESHEET)
+
+def _toolbar_label(text: str) -> QLabel:
+    """Creates a toolbar field caption, styled by the QLabel#toolbarFieldLabel rule (an object-name match, not a descendant walk)."""
+    label = QLabel(text)
+    label.setObjectName("toolbarFieldLabel")
+    return label
 
 # ---- UI Builder Class ----
 class AppUI:
     """Handles UI creation and provides access to key elements."""
     # (Docstring remains the same)
+    # Fixed attribute set: widgets are looked up on every chart update, no per-instance __dict__
+    __slots__ = (
+        'main_window', 'ticker_input', 'period_combo', 'interval_combo', 'fetch_button',
+        'graphics_widget', 'indicator_combo', 'indicator_period_spinbox', 'add_indicator_button',
+        'indicator_dock', '_interval_models', '_bulk_auto_range',
+    )
+
     def __init__(self, main_window: QMainWindow):
         """Initializes the UI builder."""
         self.main_window = main_window
@@ -115,40 +186,52 @@ class AppUI:
         self.period_combo: QComboBox = None
         self.interval_combo: QComboBox = None
         self.fetch_button: QPushButton = None
-        self.graphics_widget: pg.GraphicsLayoutWidget = None
+        self.graphics_widget = None # pg.GraphicsLayoutWidget, created in setup_ui()
         self.indicator_combo: QComboBox = None
         self.indicator_period_spinbox: QSpinBox = None
         self.add_indicator_button: QPushButton = None
         self.indicator_dock: QDockWidget = None
+        # One list model per distinct interval tuple, shared by all periods that allow the same intervals
+        self._interval_models: dict = {}
+        # ViewBox -> auto-range state saved by begin_bulk_update(), restored by end_bulk_update()
+        self._bulk_auto_range: dict = {}
 
     def setup_ui(self):
         """Creates the main UI structure."""
-        print("Setting up professional UI from ui_manager...")
-        self.graphics_widget = pg.GraphicsLayoutWidget(show=True)
-        self.graphics_widget.setMinimumSize(600, 400)
-        self.main_window.setCentralWidget(self.graphics_widget)
-        self._create_main_toolbar()
-        self._create_indicator_dock_widget()
-        print("Professional UI setup complete.")
+        logger.debug("Setting up professional UI from ui_manager...")
+        import pyqtgraph as pg # Deferred until the UI is actually built
+        # Hold off painting until the whole widget tree is in place: one layout/paint at the end
+        self.main_window.setUpdatesEnabled(False)
+        try:
+            # Not show=True: that would open the widget as its own top-level window
+            # before it is reparented into the main window
+            self.graphics_widget = pg.GraphicsLayoutWidget()
+            self.graphics_widget.setMinimumSize(600, 400)
+            self.main_window.setCentralWidget(self.graphics_widget)
+            self._create_main_toolbar()
+            self._create_indicator_dock_widget()
+        finally:
+            self.main_window.setUpdatesEnabled(True)
+        logger.debug("Professional UI setup complete.")
 
     def _create_main_toolbar(self):
         """Creates and populates the main application toolbar."""
         toolbar = QToolBar("Main Toolbar")
         toolbar.setMovable(False)
 
-        toolbar.addWidget(QLabel("Ticker:"))
+        toolbar.addWidget(_toolbar_label("Ticker:"))
         self.ticker_input = QLineEdit()
         self.ticker_input.setPlaceholderText("e.g., AAPL")
         self.ticker_input.setMinimumWidth(120)
         toolbar.addWidget(self.ticker_input)
 
-        toolbar.addWidget(QLabel("Period:"))
+        toolbar.addWidget(_toolbar_label("Period:"))
         self.period_combo = QComboBox()
         self.period_combo.addItems(FETCH_PERIODS)
         self.period_combo.setCurrentText(DEFAULT_PERIOD)
         toolbar.addWidget(self.period_combo)
 
-        toolbar.addWidget(QLabel("Interval:"))
+        toolbar.addWidget(_toolbar_label("Interval:"))
         self.interval_combo = QComboBox()
         toolbar.addWidget(self.interval_combo)
 
@@ -189,6 +272,10 @@ class AppUI:
         self.indicator_period_spinbox = QSpinBox()
         self.indicator_period_spinbox.setRange(1, 500)
         self.indicator_period_spinbox.setValue(14)
+        # Emit valueChanged once per edit (Enter/focus out), not for every typed digit.
+        # Nothing listens to it yet (the value is read on 'Add Indicator'); this keeps
+        # a future live-update connection from firing per keystroke.
+        self.indicator_period_spinbox.setKeyboardTracking(False)
         self.indicator_period_spinbox.setToolTip("Lookback period for the indicator")
         period_select_layout.addWidget(self.indicator_period_spinbox)
         dock_layout.addLayout(period_select_layout)
@@ -201,6 +288,38 @@ class AppUI:
         self.indicator_dock.setWidget(dock_content_widget)
         self.main_window.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.indicator_dock)
 
+    def begin_bulk_update(self):
+        """
+        Suspends auto-ranging on every plot in the chart before a batch of curve updates.
+
+        With auto-range on, each setData()/addItem() recomputes the view range (and
+        re-lays out the axis labels). Pair with end_bulk_update() in a finally block
+        so the ranges are recomputed once for the whole batch.
+        """
+        if self.graphics_widget is None:
+            return
+        for item in self.graphics_widget.ci.items:
+            get_view_box = getattr(item, 'getViewBox', None) # PlotItems only, not labels
+            if get_view_box is None:
+                continue
+            view_box = get_view_box()
+            if view_box not in self._bulk_auto_range:
+                self._bulk_auto_range[view_box] = view_box.autoRangeEnabled()
+            view_box.disableAutoRange()
+
+    def end_bulk_update(self):
+        """
+        Restores the auto-range state saved by begin_bulk_update().
+
+        Only axes that were auto-ranging before are re-enabled, so a range the user
+        zoomed to is kept; re-enabling schedules a single range update per plot.
+        """
+        saved, self._bulk_auto_range = self._bulk_auto_range, {}
+        for view_box, (x_auto, y_auto) in saved.items():
+            if view_box.scene() is None:
+                continue # Plot was removed during the batch
+            view_box.enableAutoRange(x=x_auto, y=y_auto)
+
     # --- Helper methods to access constants ---
     # (These remain the same)
     def get_interval_map(self):
@@ -208,4 +327,29 @@ class AppUI:
     def get_valid_intervals(self):
         return VALID_INTERVALS
     def get_default_interval(self):
-        return DEFAULT_INTERVAL
\ No newline at end of file
+        return DEFAULT_INTERVAL
+    def get_intervals_for_period(self, period):
+        """Returns the sorted tuple of intervals allowed for a period."""
+        intervals = PERIOD_TO_INTERVALS.get(period)
+        return intervals if intervals is not None else _sorted_intervals(_resolve_intervals(period))
+    def get_interval_model(self, period):
+        """
+        Returns the shared QStringListModel holding the intervals allowed for a period.
+
+        Models are built on first use and reused afterwards, so switching the interval
+        combo between periods is a setModel() swap instead of clear() + addItems().
+        They are parented to the main window: QComboBox.setModel() deletes a replaced
+        model only if the combo itself is its parent.
+
+        Args:
+            period (str): Fetch period, e.g. '1y'.
+
+        Returns:
+            QStringListModel: Model for the interval combo box.
+        """
+        intervals = self.get_intervals_for_period(period)
+        model = self._interval_models.get(intervals)
+        if model is None:
+            model = QStringListModel(list(intervals), self.main_window)
+            self._interval_models[intervals] = model
+        return model
\ No newline at end of file